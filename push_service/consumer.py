@@ -3,14 +3,26 @@ Push Notification Service
 Consumes messages from push queue and sends push notifications
 """
 import os
+import re
 import pika
-import json
+import orjson
 import logging
 import time
-import requests
+import random
+import functools
+import signal
+import threading
+import multiprocessing
+import multiprocessing.connection
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
-from datetime import datetime
-from firebase_admin import credentials, initialize_app, messaging
+from cachetools import TTLCache
+from pybloom_live import ScalableBloomFilter
+
+# firebase_admin (grpc, protobuf, google-auth) and requests are imported
+# lazily by init_firebase() / init_http_session(): the supervisor process
+# never needs them, and simulation mode never needs Firebase.
 
 # Configure logging
 logging.basicConfig(
@@ -26,33 +38,168 @@ RABBITMQ_USER = os.environ.get("RABBITMQ_USER")
 RABBITMQ_PASS = os.environ.get("RABBITMQ_PASS")
 QUEUE_NAME = os.environ.get("PUSH_QUEUE_NAME", "push.queue")
 
+# Number of unacknowledged deliveries the broker may push to us, and the
+# number of worker threads processing them concurrently
+PREFETCH_COUNT = int(os.environ.get("PREFETCH_COUNT", 50))
+
+# Number of consumer processes - RabbitMQ round-robins deliveries between
+# them, which sidesteps the GIL for the CPU-bound parts of processing
+WORKER_COUNT = int(os.environ.get("WORKER_COUNT", os.cpu_count() or 1))
+SHUTDOWN_DRAIN_TIMEOUT = 30  # seconds to wait for in-flight messages on exit
+
+# Reconnect backoff: 0.5s, 1s, 2s, ... capped, plus up to 0.5s of jitter
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30
+
+# Ack batching - successful deliveries are acked together with multiple=True
+ACK_BATCH_SIZE = int(os.environ.get("ACK_BATCH_SIZE", 32))
+ACK_FLUSH_INTERVAL = 0.1  # seconds
+
+# Backoff before requeueing a delivery whose retry/DLQ publish failed, so a
+# broker that keeps refusing publishes is not hit at full prefetch rate
+PUBLISH_FAILURE_BASE_DELAY = 1.0  # seconds
+PUBLISH_FAILURE_MAX_DELAY = 30.0  # seconds
+
 # --- External Service Contracts ---
 # Hostnames MUST be 'user-service' and 'template-service' inside Docker
 USER_SERVICE_URL = os.environ.get("USER_SERVICE_BASE_URL", "http://user-service:8081")
 TEMPLATE_SERVICE_URL = os.environ.get("TEMPLATE_SERVICE_BASE_URL", "http://template-service:8082")
 API_KEY = os.environ.get("USER_SERVICE_API_KEY")  # Used for X-Service-API-Key header
+HTTP_MAX_RETRIES = 3  # fast retries for transient errors from the services above
+
+# Sent with every service call (set once on the shared session)
+_HEADERS = {
+    "X-Service-API-Key": API_KEY,
+    "Content-Type": "application/json"
+}
+
+# Template update events published by the Template Service (fanout)
+TEMPLATE_EVENTS_EXCHANGE = os.environ.get("TEMPLATE_EVENTS_EXCHANGE", "template_events.fanout")
+
+# Lookup cache configuration (seconds)
+USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", 60))
+TEMPLATE_CACHE_TTL = int(os.environ.get("TEMPLATE_CACHE_TTL", 300))
 
 # Firebase configuration
 FIREBASE_CREDENTIALS_PATH = os.environ.get("FIREBASE_CREDENTIALS_PATH", "firebase-credentials.json")
 
+# FCM batching - notifications are sent in bulk with messaging.send_each
+FCM_MAX_BATCH_SIZE = 500  # FCM maximum per batch call
+# No more than PREFETCH_COUNT deliveries are ever in flight, so a batch that
+# waited for more would always sit out the full flush interval
+FCM_BATCH_SIZE = min(FCM_MAX_BATCH_SIZE, PREFETCH_COUNT)
+FCM_FLUSH_INTERVAL = 0.1  # seconds to wait for a batch to fill
+
+# Redelivery dedupe - recently delivered notifications are remembered so a
+# redelivered copy (e.g. after a channel died before its ack) is dropped
+DEDUPE_CAPACITY = 100_000
+DEDUPE_ERROR_RATE = 1e-4
+DEDUPE_ROTATE_INTERVAL = 3600  # seconds
+
 # Retry configuration
 MAX_RETRY_COUNT = 3
-RETRY_DELAYS = [60, 300, 900]  # 1 min, 5 min, 15 min (exponential backoff)
+RETRY_DELAYS = (60, 300, 900)  # 1 min, 5 min, 15 min (exponential backoff)
+_MAX_RETRY_IDX = len(RETRY_DELAYS) - 1  # later attempts reuse the longest delay
+DLQ_NAME = "failed.queue"
 
-# Initialize Firebase (if credentials exist)
+# Set by init_firebase() in each consumer process
 firebase_initialized = False
-try:
-    if os.path.exists(FIREBASE_CREDENTIALS_PATH):
-        cred = credentials.Certificate(FIREBASE_CREDENTIALS_PATH)
-        initialize_app(cred)
-        firebase_initialized = True
-        logger.info("Firebase initialized successfully")
-    else:
-        logger.warning(f"Firebase credentials not found at {FIREBASE_CREDENTIALS_PATH}")
+messaging = None  # firebase_admin.messaging, once imported
+_ANDROID_CONFIG = None
+_APNS_CONFIG = None
+
+# Shared HTTP session, created per process by init_http_session()
+SESSION = None
+HTTP_TIMEOUT = ()  # requests.exceptions.Timeout once requests is imported
+
+# In-process lookup caches - repeat messages for the same user/template are
+# served from memory. Shared by all worker threads, hence the lock.
+user_cache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+template_cache = TTLCache(maxsize=1_000, ttl=TEMPLATE_CACHE_TTL)
+cache_lock = threading.Lock()
+
+# Worker pool - pika's BlockingConnection dispatches callbacks one at a time,
+# so messages are processed off the I/O thread to overlap their HTTP/FCM calls
+executor = ThreadPoolExecutor(max_workers=PREFETCH_COUNT, thread_name_prefix="push-worker")
+
+# Separate pool for lookups a worker waits on, so workers never block on
+# tasks queued behind themselves in the main pool
+fetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_COUNT, thread_name_prefix="push-fetch")
+
+
+def init_firebase():
+    """
+    Initialize Firebase (if credentials exist).
+    Called from start_consumer so every worker process gets its own
+    app and gRPC channels rather than inheriting them.
+    """
+    global firebase_initialized, messaging, _ANDROID_CONFIG, _APNS_CONFIG
+    try:
+        if os.path.exists(FIREBASE_CREDENTIALS_PATH):
+            from firebase_admin import credentials, initialize_app
+            from firebase_admin import messaging as fcm_messaging
+            
+            cred = credentials.Certificate(FIREBASE_CREDENTIALS_PATH)
+            initialize_app(cred)
+            messaging = fcm_messaging
+            
+            # Platform options are identical for every notification, so build them once
+            _ANDROID_CONFIG = messaging.AndroidConfig(
+                priority='high',
+                notification=messaging.AndroidNotification(
+                    sound='default',
+                    priority='max'
+                )
+            )
+            _APNS_CONFIG = messaging.APNSConfig(
+                payload=messaging.APNSPayload(
+                    aps=messaging.Aps(
+                        sound='default',
+                        badge=1
+                    )
+                )
+            )
+            
+            firebase_initialized = True
+            logger.info("Firebase initialized successfully")
+        else:
+            logger.warning(f"Firebase credentials not found at {FIREBASE_CREDENTIALS_PATH}")
+            logger.warning("Push notifications will be simulated (logged only)")
+    except Exception as e:
+        logger.error(f"Failed to initialize Firebase: {str(e)}")
         logger.warning("Push notifications will be simulated (logged only)")
-except Exception as e:
-    logger.error(f"Failed to initialize Firebase: {str(e)}")
-    logger.warning("Push notifications will be simulated (logged only)")
+
+
+def init_http_session():
+    """
+    Create the shared HTTP session - keeps connections to the user/template
+    services alive across messages instead of opening a new TCP connection
+    per request. Transient failures are retried here with a short backoff
+    before a message falls back to the (minutes long) queue-level retry or
+    the DLQ.
+    """
+    global SESSION, HTTP_TIMEOUT
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=max(64, PREFETCH_COUNT),  # one connection per worker thread
+        max_retries=Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=0.1,  # 0.1s, 0.2s, 0.4s
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            raise_on_status=False  # hand the final response back to the caller
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(_HEADERS)
+    SESSION = session
+    HTTP_TIMEOUT = requests.exceptions.Timeout
 
 
 def get_rabbitmq_connection():
@@ -74,29 +221,220 @@ def get_rabbitmq_connection():
         raise
 
 
+def run_threadsafe(ch, callback, *args, **kwargs):
+    """
+    Schedule a channel operation on the pika I/O thread.
+    pika channels are not thread-safe, so worker threads must never
+    touch the channel directly.
+    """
+    def _callback():
+        if ch.is_open:
+            callback(*args, **kwargs)
+        else:
+            logger.warning("Channel closed before queued operation could run")
+
+    try:
+        ch.connection.add_callback_threadsafe(_callback)
+    except Exception as e:
+        logger.error(f"Failed to schedule channel operation: {str(e)}")
+
+
+class AckBatcher:
+    """
+    Coalesces acks for one channel into basic_ack(multiple=True) frames.
+
+    Deliveries finish out of order on the worker pool, so a batch ack only
+    covers tags below the oldest delivery that is still unsettled; later
+    completions are acked one by one on the same flush. Nacks are
+    always sent individually so a failure is never swept up by a batch ack.
+    Only ack(), nack() and ack_after_publish() may be called from worker
+    threads; everything else runs on the pika I/O thread.
+    """
+
+    def __init__(self, connection, channel, publish_channel):
+        self.connection = connection
+        self.channel = channel
+        self.publish_channel = publish_channel  # confirm-mode channel for retry/DLQ
+        self.unsettled = set()  # delivered, not yet acked or nacked
+        self.completed = set()  # processed successfully, ack not yet sent
+        self.timer = None
+        self.publish_failures = 0  # consecutive failed retry/DLQ publishes
+
+    def track(self, delivery_tag: int):
+        """Register a new delivery (called from on_message)"""
+        self.unsettled.add(delivery_tag)
+
+    def in_flight(self) -> int:
+        """Number of deliveries still being processed"""
+        return len(self.unsettled) - len(self.completed)
+
+    def ack(self, delivery_tag: int):
+        """Mark a delivery as successfully processed"""
+        run_threadsafe(self.channel, self._on_ack, delivery_tag)
+
+    def nack(self, delivery_tag: int):
+        """Reject a delivery without requeue"""
+        run_threadsafe(self.channel, self._on_nack, delivery_tag)
+
+    def ack_after_publish(self, delivery_tag: int, publish, *args):
+        """
+        Run a retry/DLQ publish on the I/O thread, on the publisher channel,
+        and ack the delivery only once the broker has confirmed it. If the publish fails the delivery
+        is requeued after a backoff, so a lost publish can never also lose the original.
+        """
+        run_threadsafe(self.channel, self._on_publish, delivery_tag, publish, *args)
+
+    def _on_ack(self, delivery_tag: int):
+        self.completed.add(delivery_tag)
+        if len(self.completed) >= ACK_BATCH_SIZE:
+            self.flush()
+        self._arm_timer()
+
+    def _on_nack(self, delivery_tag: int, requeue: bool = False):
+        self.unsettled.discard(delivery_tag)
+        self.channel.basic_nack(delivery_tag=delivery_tag, requeue=requeue)
+
+    def _on_publish(self, delivery_tag: int, publish, *args):
+        if publish(self.publish_channel, *args):
+            self.publish_failures = 0
+            self._on_ack(delivery_tag)
+            return
+
+        # Hold the delivery (it keeps its prefetch slot) and requeue it after
+        # a backoff that grows while the broker keeps refusing publishes
+        delay = min(
+            PUBLISH_FAILURE_MAX_DELAY,
+            PUBLISH_FAILURE_BASE_DELAY * 2 ** min(self.publish_failures, 10)
+        )
+        self.publish_failures += 1
+        logger.warning(
+            f"Retry/DLQ publish failed for delivery {delivery_tag} "
+            f"({self.publish_failures} in a row); requeueing it in {delay:.1f}s"
+        )
+        self.connection.call_later(delay, functools.partial(self._requeue, delivery_tag))
+
+    def _requeue(self, delivery_tag: int):
+        # A closed channel has already returned the delivery to the queue
+        if self.channel.is_open:
+            self._on_nack(delivery_tag, requeue=True)
+
+    def _arm_timer(self):
+        if self.completed and self.timer is None:
+            self.timer = self.connection.call_later(ACK_FLUSH_INTERVAL, self._on_timer)
+
+    def _on_timer(self):
+        self.timer = None
+        if self.channel.is_open:
+            self.flush()
+
+    def flush(self):
+        """
+        Ack every completed delivery: one multiple=True frame for the settled
+        prefix below the oldest pending delivery, and individual acks for
+        completions above it, so a slow delivery never holds back the rest
+        (and, with them, the prefetch window).
+        """
+        if not self.completed:
+            return
+
+        pending = self.unsettled - self.completed
+        if pending:
+            oldest_pending = min(pending)
+            prefix = {tag for tag in self.completed if tag < oldest_pending}
+        else:
+            prefix = set(self.completed)
+
+        if prefix:
+            self.channel.basic_ack(delivery_tag=max(prefix), multiple=len(prefix) > 1)
+        for tag in sorted(self.completed - prefix):
+            self.channel.basic_ack(delivery_tag=tag, multiple=False)
+
+        self.unsettled -= self.completed
+        self.completed.clear()
+
+
+class DeliveredFilter:
+    """
+    Bloom filter over recently delivered notifications.
+
+    Two generations are kept and the older one is dropped every
+    DEDUPE_ROTATE_INTERVAL, so memory stays bounded and an entry is
+    remembered for between one and two intervals. A false positive would
+    drop a message, so callers only consult it for redeliveries.
+    """
+
+    def __init__(self, rotate_interval: int = DEDUPE_ROTATE_INTERVAL):
+        self.rotate_interval = rotate_interval
+        self.lock = threading.Lock()
+        self.current = self._new_filter()
+        self.previous = self._new_filter()
+        self.rotated_at = time.monotonic()
+
+    @staticmethod
+    def _new_filter() -> ScalableBloomFilter:
+        return ScalableBloomFilter(initial_capacity=DEDUPE_CAPACITY, error_rate=DEDUPE_ERROR_RATE)
+
+    def _maybe_rotate(self):
+        now = time.monotonic()
+        if now - self.rotated_at >= self.rotate_interval:
+            self.previous = self.current
+            self.current = self._new_filter()
+            self.rotated_at = now
+
+    def add(self, key: str):
+        with self.lock:
+            self._maybe_rotate()
+            self.current.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            self._maybe_rotate()
+            return key in self.current or key in self.previous
+
+
+delivered = DeliveredFilter()
+
+
+def ttl_cached(cache: TTLCache):
+    """
+    Cache the result of a single-argument fetch function.
+    Failed lookups (None) are not cached so they are retried next time.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(key):
+            with cache_lock:
+                value = cache.get(key)
+            if value is not None:
+                return value
+
+            value = func(key)
+            if value is not None:
+                with cache_lock:
+                    cache[key] = value
+            return value
+        return wrapper
+    return decorator
+
+
+@ttl_cached(user_cache)
 def fetch_user_data(user_id: str) -> Optional[Dict[str, Any]]:
     """Fetch user data from User Service"""
     try:
-        headers = {
-            "X-Service-API-Key": API_KEY,
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.get(
+        response = SESSION.get(
             f"{USER_SERVICE_URL}/api/v1/users/{user_id}",
-            headers=headers,
             timeout=5
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"User data fetched for user_id: {user_id}")
             return data.get("data")
         else:
             logger.error(f"Failed to fetch user data: {response.status_code} - {response.text}")
             return None
             
-    except requests.exceptions.Timeout:
+    except HTTP_TIMEOUT:
         logger.error(f"Timeout fetching user data for user_id: {user_id}")
         return None
     except Exception as e:
@@ -104,29 +442,24 @@ def fetch_user_data(user_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+@ttl_cached(template_cache)
 def fetch_template_data(template_code: str) -> Optional[Dict[str, Any]]:
     """Fetch template data from Template Service"""
     try:
-        headers = {
-            "X-Service-API-Key": API_KEY,
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.get(
+        response = SESSION.get(
             f"{TEMPLATE_SERVICE_URL}/api/v1/templates/{template_code}",
-            headers=headers,
             timeout=5
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"Template data fetched for template_code: {template_code}")
             return data.get("data")
         else:
             logger.error(f"Failed to fetch template data: {response.status_code} - {response.text}")
             return None
             
-    except requests.exceptions.Timeout:
+    except HTTP_TIMEOUT:
         logger.error(f"Timeout fetching template for template_code: {template_code}")
         return None
     except Exception as e:
@@ -134,27 +467,155 @@ def fetch_template_data(template_code: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# Matches {{key}} placeholders in templates
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+
+
 def render_template_variables(template_string: str, variables: Dict[str, Any]) -> str:
-    """Simple variable substitution in template"""
+    """Substitute {{key}} placeholders in a single pass over the template"""
     if not template_string:
         return ""
     
-    result = template_string
-    for key, value in variables.items():
-        placeholder = f"{{{{{key}}}}}"  # {{key}}
-        result = result.replace(placeholder, str(value))
+    def _substitute(match):
+        key = match.group(1)
+        # Unknown placeholders are left untouched
+        return str(variables[key]) if key in variables else match.group(0)
     
-    return result
+    return PLACEHOLDER_PATTERN.sub(_substitute, template_string)
+
+
+def build_fcm_message(
+    device_token: str,
+    title: str,
+    body: str,
+    data: Optional[Dict[str, str]] = None,
+    image_url: Optional[str] = None
+) -> "messaging.Message":
+    """Build a Firebase Cloud Messaging message for a single device"""
+    notification = messaging.Notification(
+        title=title,
+        body=body,
+        image=image_url
+    )
+
+    return messaging.Message(
+        notification=notification,
+        data=data or {},
+        token=device_token,
+        android=_ANDROID_CONFIG,
+        apns=_APNS_CONFIG
+    )
+
+
+class FcmBatchSender:
+    """
+    Buffers outgoing FCM messages and sends them in bulk with
+    messaging.send_each, so many notifications share one round of HTTP
+    calls instead of paying one round-trip each. A batch is flushed when
+    FCM_BATCH_SIZE messages are queued or FCM_FLUSH_INTERVAL has passed.
+    Each result is handed back to the worker pool.
+    """
+
+    def __init__(self, batch_size: int = FCM_BATCH_SIZE, flush_interval: float = FCM_FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = deque()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def start(self):
+        """Start the background flush thread (idempotent)"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="fcm-batcher", daemon=True)
+            self.thread.start()
+
+    def submit(self, message: "messaging.Message", device_token: str, on_result):
+        """Queue a message; on_result(success) runs on the worker pool once sent"""
+        with self.condition:
+            self.buffer.append((message, device_token, on_result))
+            # Wake the flush thread to start a batch, or to send a full one
+            if len(self.buffer) == 1 or len(self.buffer) >= self.batch_size:
+                self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.buffer:
+                    self.condition.wait()
+                # Give the batch a moment to fill unless it is already full
+                if len(self.buffer) < self.batch_size:
+                    self.condition.wait(timeout=self.flush_interval)
+                count = min(len(self.buffer), self.batch_size)
+                batch = [self.buffer.popleft() for _ in range(count)]
+
+            self._flush(batch)
+
+    def _flush(self, batch):
+        """
+        Send one batch and report every outcome. Never raises: an error here
+        would kill the flush thread and strand every later delivery, so a
+        batch that fails unexpectedly is reported as failed (retry/DLQ).
+        """
+        try:
+            outcomes = self._send(batch)
+        except Exception:
+            logger.error("Unexpected error in FCM batch flush", exc_info=True)
+            outcomes = [False] * len(batch)
+
+        for (_, _, on_result), success in zip(batch, outcomes):
+            try:
+                executor.submit(on_result, success)
+            except RuntimeError:
+                # Worker pool already shut down; report from this thread instead
+                try:
+                    on_result(success)
+                except Exception:
+                    logger.error("Error reporting push notification result", exc_info=True)
+
+    def _send(self, batch):
+        """Send a batch with messaging.send_each; returns one success flag per message"""
+        try:
+            results = list(messaging.send_each([message for message, _, _ in batch]).responses)
+        except Exception as e:
+            logger.error(f"Error sending push notification batch: {str(e)}")
+            results = []
+
+        logger.info(f"FCM batch sent: {len(batch)} message(s)")
+
+        # A short response list leaves the remaining messages unsent
+        results += [None] * (len(batch) - len(results))
+
+        outcomes = []
+        for (_, device_token, _), result in zip(batch, results):
+            if result is not None:
+                if result.success:
+                    logger.info(f"Push notification sent successfully: {result.message_id}")
+                elif isinstance(result.exception, messaging.UnregisteredError):
+                    logger.error(f"Device token is invalid or unregistered: {device_token}")
+                elif isinstance(result.exception, messaging.SenderIdMismatchError):
+                    logger.error(f"Sender ID mismatch for token: {device_token}")
+                else:
+                    logger.error(f"Error sending push notification: {str(result.exception)}")
+
+            outcomes.append(result is not None and result.success)
+        return outcomes
+
+fcm_sender = FcmBatchSender()
 
 
 def send_push_notification_fcm(
     device_token: str,
     title: str,
     body: str,
+    on_result,
     data: Optional[Dict[str, str]] = None,
     image_url: Optional[str] = None
-) -> bool:
-    """Send push notification via Firebase Cloud Messaging"""
+):
+    """
+    Send push notification via Firebase Cloud Messaging.
+    The message is queued for batched delivery; on_result(success) is
+    called once the outcome is known.
+    """
     if not firebase_initialized:
         # Simulate notification for testing without Firebase
         logger.info(f"[SIMULATED] Push notification sent to {device_token[:20]}...")
@@ -162,54 +623,23 @@ def send_push_notification_fcm(
         logger.info(f"  Body: {body}")
         logger.info(f"  Data: {data}")
         logger.info(f"  Image: {image_url}")
-        return True
+        on_result(True)
+        return
     
     try:
-        # Build notification
-        notification = messaging.Notification(
-            title=title,
-            body=body,
-            image=image_url
-        )
-        
-        # Build message
-        message = messaging.Message(
-            notification=notification,
-            data=data or {},
-            token=device_token,
-            android=messaging.AndroidConfig(
-                priority='high',
-                notification=messaging.AndroidNotification(
-                    sound='default',
-                    priority='max'
-                )
-            ),
-            apns=messaging.APNSConfig(
-                payload=messaging.APNSPayload(
-                    aps=messaging.Aps(
-                        sound='default',
-                        badge=1
-                    )
-                )
-            )
-        )
-        
-        # Send message
-        response = messaging.send(message)
-        logger.info(f"Push notification sent successfully: {response}")
-        return True
-        
-    except messaging.UnregisteredError:
-        logger.error(f"Device token is invalid or unregistered: {device_token}")
-        return False
-        
-    except messaging.SenderIdMismatchError:
-        logger.error(f"Sender ID mismatch for token: {device_token}")
-        return False
-        
+        message = build_fcm_message(device_token, title, body, data, image_url)
     except Exception as e:
-        logger.error(f"Error sending push notification: {str(e)}")
-        return False
+        logger.error(f"Error building push notification: {str(e)}")
+        on_result(False)
+        return
+
+    fcm_sender.submit(message, device_token, on_result)
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as ISO 8601 with millisecond precision, e.g. 2024-01-01T12:00:00.123Z"""
+    t = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)) + f".{int(t % 1 * 1000):03d}Z"
 
 
 def update_notification_status(
@@ -219,25 +649,19 @@ def update_notification_status(
 ):
     """Update notification status via User Service or API Gateway"""
     try:
-        headers = {
-            "X-Service-API-Key": API_KEY,
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "notification_id": notification_id,
             "status": status,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utcnow_iso()
         }
         
         if error:
             payload["error"] = error
         
         # Try to update status (adjust endpoint as needed)
-        response = requests.post(
+        response = SESSION.post(
             f"{USER_SERVICE_URL}/api/v1/push/status/",
-            json=payload,
-            headers=headers,
+            data=orjson.dumps(payload),
             timeout=5
         )
         
@@ -250,112 +674,191 @@ def update_notification_status(
         logger.error(f"Error updating notification status: {str(e)}")
 
 
-def move_to_dlq(channel, message: Dict[str, Any], reason: str):
-    """Move failed message to dead letter queue"""
+def retry_queue_name(delay: int) -> str:
+    """Name of the TTL queue holding retries for the given delay"""
+    return f"push.retry.{delay}"
+
+
+def declare_failure_queues(channel):
+    """
+    Declare the retry and DLQ queues once per connection so failure
+    handling is a plain publish.
+    """
+    for delay in RETRY_DELAYS:
+        # Retry queue with TTL that dead-letters back to main queue
+        channel.queue_declare(
+            queue=retry_queue_name(delay),
+            durable=True,
+            arguments={
+                'x-message-ttl': delay * 1000,  # Convert to milliseconds
+                'x-dead-letter-exchange': '',
+                'x-dead-letter-routing-key': QUEUE_NAME
+            }
+        )
+
+    channel.queue_declare(queue=DLQ_NAME, durable=True)
+
+
+def move_to_dlq(channel, body: bytes, properties, notification_id: str, reason: str) -> bool:
+    """
+    Move failed message to dead letter queue.
+    The body is republished unchanged; failure details travel in headers.
+    Returns True once the broker has confirmed the publish.
+    """
     try:
-        dlq_name = "failed.queue"
-        channel.queue_declare(queue=dlq_name, durable=True)
-        
-        message["failure_reason"] = reason
-        message["failed_at"] = datetime.utcnow().isoformat() + "Z"
+        headers = dict(properties.headers or {})
+        headers["x-failure-reason"] = reason
+        headers["x-failed-at"] = _utcnow_iso()
         
         channel.basic_publish(
             exchange='',
-            routing_key=dlq_name,
-            body=json.dumps(message),
-            properties=pika.BasicProperties(delivery_mode=2)
+            routing_key=DLQ_NAME,
+            body=body,
+            properties=pika.BasicProperties(delivery_mode=2, headers=headers)
         )
         
-        logger.warning(f"Message moved to DLQ: {message.get('notification_id')} - Reason: {reason}")
+        logger.warning(f"Message moved to DLQ: {notification_id} - Reason: {reason}")
+        return True
         
     except Exception as e:
         logger.error(f"Failed to move message to DLQ: {str(e)}")
+        return False
 
 
-def schedule_retry(channel, message: Dict[str, Any], delay: int):
-    """Schedule message retry with delay using TTL queue"""
+def schedule_retry(channel, body: bytes, properties, notification_id: str, retry_count: int, delay: int) -> bool:
+    """
+    Schedule message retry with delay using TTL queue.
+    The body is republished unchanged; the attempt number is carried in
+    the x-retry-count header. Returns True once the broker has confirmed
+    the publish.
+    """
     try:
-        retry_queue = f"push.retry.{delay}"
+        headers = dict(properties.headers or {})
+        headers["x-retry-count"] = retry_count
         
-        # Declare retry queue with TTL that dead-letters back to main queue
-        channel.queue_declare(
-            queue=retry_queue,
-            durable=True,
-            arguments={
-                'x-message-ttl': delay * 1000,  # Convert to milliseconds
-                'x-dead-letter-exchange': '',
-                'x-dead-letter-routing-key': QUEUE_NAME
-            }
-        )
-        
-        # Publish to retry queue
+        # Publish to retry queue (declared at startup)
         channel.basic_publish(
             exchange='',
-            routing_key=retry_queue,
-            body=json.dumps(message),
-            properties=pika.BasicProperties(delivery_mode=2)
+            routing_key=retry_queue_name(delay),
+            body=body,
+            properties=pika.BasicProperties(delivery_mode=2, headers=headers)
         )
         
-        retry_count = message.get("retry_count", 0)
-        logger.info(f"Message scheduled for retry {retry_count + 1}/{MAX_RETRY_COUNT} in {delay}s: {message.get('notification_id')}")
+        logger.info(f"Message scheduled for retry {retry_count}/{MAX_RETRY_COUNT} in {delay}s: {notification_id}")
+        return True
         
     except Exception as e:
         logger.error(f"Failed to schedule retry: {str(e)}")
+        return False
+
+
+def fetch_push_content(ch, method, properties, body, acker: AckBatcher, message: Dict[str, Any]):
+    """
+    Look up the user and template for a message and render it.
+    Returns (push_token, title, body, image_url), or None if the delivery
+    has already been settled (DLQ or skipped).
+    """
+    notification_id = message.get("notification_id")
+    user_id = message.get("user_id")
+    template_code = message.get("template_code")
+    variables = message.get("variables", {})
+    
+    # Fetch template in the background while the user is fetched, so the
+    # two lookups cost one round-trip instead of two
+    template_future = fetch_executor.submit(fetch_template_data, template_code)
+    
+    # Fetch user data
+    user_data = fetch_user_data(user_id)
+    if not user_data:
+        logger.error(f"User not found: {user_id}")
+        acker.ack_after_publish(method.delivery_tag, move_to_dlq, body, properties, notification_id, "User not found")
+        update_notification_status(notification_id, "failed", "User not found")
+        return None
+    
+    # Check if user has push token
+    push_token = user_data.get("push_token")
+    if not push_token:
+        logger.error(f"No push token found for user: {user_id}")
+        acker.ack_after_publish(method.delivery_tag, move_to_dlq, body, properties, notification_id, "Missing push token")
+        update_notification_status(notification_id, "failed", "Missing push token")
+        return None
+    
+    # Check user preferences
+    preferences = user_data.get("preferences", {})
+    if not preferences.get("push", True):
+        logger.info(f"User {user_id} has disabled push notifications")
+        acker.ack(method.delivery_tag)
+        update_notification_status(notification_id, "skipped", "User disabled push notifications")
+        return None
+    
+    # Wait for template
+    template_data = template_future.result()
+    if not template_data:
+        logger.error(f"Template not found: {template_code}")
+        acker.ack_after_publish(method.delivery_tag, move_to_dlq, body, properties, notification_id, "Template not found")
+        update_notification_status(notification_id, "failed", "Template not found")
+        return None
+    
+    # Render template
+    title = render_template_variables(template_data.get("title", "Notification"), variables)
+    body_text = render_template_variables(template_data.get("body", ""), variables)
+    return push_token, title, body_text, template_data.get("image_url")
 
 
-def process_message(ch, method, properties, body):
-    """Process push notification message from queue"""
+def process_message(ch, method, properties, body, acker: AckBatcher):
+    """
+    Process push notification message from queue.
+    
+    Message schema:
+        notification_id  str   required
+        user_id          str   user to look up in the User Service
+        template_code    str   template to look up in the Template Service
+        variables        dict  values for {{placeholders}}; "link" and "meta"
+                               are also copied into the FCM data payload
+    
+    Producers that already know the recipient can enrich the message so
+    both lookups are skipped:
+        push_token       str   device token to send to
+        preferences      dict  optional, {"push": false} skips the send
+        rendered         dict  {"title": str, "body": str, "image_url": str?}
+    """
     try:
         # Parse message
-        message = json.loads(body)
+        message = orjson.loads(body)
         
         notification_id = message.get("notification_id")
         user_id = message.get("user_id")
-        template_code = message.get("template_code")
         variables = message.get("variables", {})
-        retry_count = message.get("retry_count", 0)
+        # Retry attempts are tracked in headers; "retry_count" in the body is
+        # the legacy location, still honoured for messages already queued
+        retry_count = (properties.headers or {}).get("x-retry-count", message.get("retry_count", 0))
         
         logger.info(f"Processing notification: {notification_id} (attempt {retry_count + 1}/{MAX_RETRY_COUNT + 1})")
         
-        # Fetch user data
-        user_data = fetch_user_data(user_id)
-        if not user_data:
-            logger.error(f"User not found: {user_id}")
-            move_to_dlq(ch, message, "User not found")
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-            update_notification_status(notification_id, "failed", "User not found")
-            return
-        
-        # Check if user has push token
-        push_token = user_data.get("push_token")
-        if not push_token:
-            logger.error(f"No push token found for user: {user_id}")
-            move_to_dlq(ch, message, "Missing push token")
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-            update_notification_status(notification_id, "failed", "Missing push token")
+        # Retries reuse the notification_id, so the attempt is part of the key
+        dedupe_key = f"{notification_id}:{retry_count}"
+        if method.redelivered and dedupe_key in delivered:
+            logger.info(f"Dropping duplicate delivery: {notification_id}")
+            acker.ack(method.delivery_tag)
             return
         
-        # Check user preferences
-        preferences = user_data.get("preferences", {})
-        if not preferences.get("push", True):
-            logger.info(f"User {user_id} has disabled push notifications")
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-            update_notification_status(notification_id, "skipped", "User disabled push notifications")
-            return
-        
-        # Fetch template
-        template_data = fetch_template_data(template_code)
-        if not template_data:
-            logger.error(f"Template not found: {template_code}")
-            move_to_dlq(ch, message, "Template not found")
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-            update_notification_status(notification_id, "failed", "Template not found")
-            return
-        
-        # Render template
-        title = render_template_variables(template_data.get("title", "Notification"), variables)
-        body_text = render_template_variables(template_data.get("body", ""), variables)
-        image_url = template_data.get("image_url")
+        push_token = message.get("push_token")
+        rendered = message.get("rendered")
+        if push_token and rendered:
+            # Enriched by the producer - no user/template lookups needed
+            if not message.get("preferences", {}).get("push", True):
+                logger.info(f"User {user_id} has disabled push notifications")
+                acker.ack(method.delivery_tag)
+                update_notification_status(notification_id, "skipped", "User disabled push notifications")
+                return
+            title = rendered.get("title", "Notification")
+            body_text = rendered.get("body", "")
+            image_url = rendered.get("image_url")
+        else:
+            content = fetch_push_content(ch, method, properties, body, acker, message)
+            if content is None:
+                return
+            push_token, title, body_text, image_url = content
         
         # Prepare data payload
         data_payload = {
@@ -367,18 +870,43 @@ def process_message(ch, method, properties, body):
         if variables.get("meta"):
             data_payload.update(variables.get("meta"))
         
-        # Send push notification
-        success = send_push_notification_fcm(
+        # Send push notification - the outcome is handled by complete_delivery
+        send_push_notification_fcm(
             device_token=push_token,
             title=title,
             body=body_text,
+            on_result=functools.partial(
+                complete_delivery, ch, method, properties, body, acker, notification_id, retry_count
+            ),
             data=data_payload,
             image_url=image_url
         )
         
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Invalid JSON message: {str(e)}")
+        acker.nack(method.delivery_tag)
+        
+    except Exception as e:
+        logger.error(f"Error processing message: {str(e)}", exc_info=True)
+        acker.nack(method.delivery_tag)
+
+
+def complete_delivery(
+    ch,
+    method,
+    properties,
+    body: bytes,
+    acker: AckBatcher,
+    notification_id: str,
+    retry_count: int,
+    success: bool
+):
+    """Settle a delivery once its push notification has been sent (or failed)"""
+    try:
         if success:
             # Success - acknowledge and update status
-            ch.basic_ack(delivery_tag=method.delivery_tag)
+            acker.ack(method.delivery_tag)
+            delivered.add(f"{notification_id}:{retry_count}")
             update_notification_status(notification_id, "delivered")
             logger.info(f"Push notification delivered successfully: {notification_id}")
             
@@ -386,47 +914,114 @@ def process_message(ch, method, properties, body):
             # Failed - retry or move to DLQ
             if retry_count < MAX_RETRY_COUNT:
                 # Schedule retry
-                message["retry_count"] = retry_count + 1
-                delay = RETRY_DELAYS[retry_count] if retry_count < len(RETRY_DELAYS) else RETRY_DELAYS[-1]
+                delay = RETRY_DELAYS[min(retry_count, _MAX_RETRY_IDX)]
                 
-                schedule_retry(ch, message, delay)
-                ch.basic_ack(delivery_tag=method.delivery_tag)
+                acker.ack_after_publish(method.delivery_tag, schedule_retry, body, properties, notification_id, retry_count + 1, delay)
                 update_notification_status(notification_id, "pending", f"Retry scheduled (attempt {retry_count + 1})")
                 
             else:
                 # Max retries exceeded - move to DLQ
-                move_to_dlq(ch, message, "Max retries exceeded")
-                ch.basic_ack(delivery_tag=method.delivery_tag)
+                acker.ack_after_publish(method.delivery_tag, move_to_dlq, body, properties, notification_id, "Max retries exceeded")
                 update_notification_status(notification_id, "failed", "Max retries exceeded")
                 logger.error(f"Push delivery failed after {MAX_RETRY_COUNT} attempts: {notification_id}")
-        
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON message: {str(e)}")
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-        
+
     except Exception as e:
-        logger.error(f"Error processing message: {str(e)}", exc_info=True)
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+        logger.error(f"Error completing delivery: {str(e)}", exc_info=True)
+        acker.nack(method.delivery_tag)
+
+
+def on_template_event(ch, method, properties, body):
+    """Evict a cached template when the Template Service publishes an update"""
+    try:
+        event = orjson.loads(body)
+        name = event.get("name")
+        if name:
+            with cache_lock:
+                evicted = template_cache.pop(name, None)
+            if evicted is not None:
+                logger.info(f"Template cache invalidated for: {name}")
+    except Exception as e:
+        logger.error(f"Invalid template event: {str(e)}")
+
+
+def on_message(acker: AckBatcher, ch, method, properties, body):
+    """Hand a delivery off to the worker pool (runs on the pika I/O thread)"""
+    acker.track(method.delivery_tag)
+    executor.submit(process_message, ch, method, properties, body, acker)
+
+
+def drain_in_flight(connection, acker: AckBatcher, timeout: int = SHUTDOWN_DRAIN_TIMEOUT):
+    """
+    Wait for in-flight deliveries to finish so their acks reach the
+    broker before the connection is closed.
+    """
+    if acker.in_flight():
+        logger.info(f"Draining {acker.in_flight()} in-flight message(s)...")
+
+    deadline = time.monotonic() + timeout
+    while acker.in_flight() and time.monotonic() < deadline:
+        # Keep servicing the I/O loop so threadsafe acks get applied
+        connection.process_data_events(time_limit=0.1)
+
+    if acker.in_flight():
+        logger.warning(f"{acker.in_flight()} message(s) still in flight after {timeout}s; they will be redelivered")
+
+    # Run acks queued by the last workers, then send whatever batch is left
+    connection.process_data_events(time_limit=0)
+    acker.flush()
+
+
+def reconnect_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so restarted consumers don't reconnect in lockstep"""
+    return min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt) + random.uniform(0, 0.5)
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    """SIGTERM handler: shut down exactly as on Ctrl+C"""
+    raise KeyboardInterrupt
 
 
 def start_consumer():
     """Start consuming messages from push queue"""
+    # docker stop / orchestrators send SIGTERM; treat it like Ctrl+C so
+    # in-flight deliveries are drained instead of killed and redelivered
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    
+    init_firebase()
+    init_http_session()
+    
     logger.info("=" * 60)
     logger.info("Starting Push Service Consumer")
     logger.info("=" * 60)
     logger.info(f"RabbitMQ Host: {RABBITMQ_HOST}:{RABBITMQ_PORT}")
     logger.info(f"Queue Name: {QUEUE_NAME}")
+    logger.info(f"Prefetch Count: {PREFETCH_COUNT}")
     logger.info(f"User Service: {USER_SERVICE_URL}")
     logger.info(f"Template Service: {TEMPLATE_SERVICE_URL}")
     logger.info(f"Firebase Initialized: {firebase_initialized}")
     logger.info("=" * 60)
     
+    if firebase_initialized:
+        fcm_sender.start()
+    
+    connection = None
+    channel = None
+    acker = None
+    reconnect_attempt = 0
+
     while True:
         try:
             # Connect to RabbitMQ
             connection = get_rabbitmq_connection()
             channel = connection.channel()
             
+            # Dedicated channel for retry/DLQ publishes, reused for the life of
+            # the connection. Publisher confirms make these publishes raise if
+            # the broker does not accept them, instead of vanishing on a broker
+            # crash, without putting the consuming channel in confirm mode.
+            publish_channel = connection.channel()
+            publish_channel.confirm_delivery()
+            
             # Declare queue (idempotent)
             channel.queue_declare(
                 queue=QUEUE_NAME,
@@ -434,33 +1029,114 @@ def start_consumer():
                 arguments={'x-max-priority': 10}
             )
             
-            # Set QoS - process one message at a time
-            channel.basic_qos(prefetch_count=1)
+            # Declare retry and dead letter queues (idempotent)
+            declare_failure_queues(channel)
+            
+            # Subscribe to template updates for cache invalidation
+            channel.exchange_declare(
+                exchange=TEMPLATE_EVENTS_EXCHANGE,
+                exchange_type='fanout',
+                durable=True
+            )
+            events_queue = channel.queue_declare(queue='', exclusive=True).method.queue
+            channel.queue_bind(queue=events_queue, exchange=TEMPLATE_EVENTS_EXCHANGE)
+            channel.basic_consume(
+                queue=events_queue,
+                on_message_callback=on_template_event,
+                auto_ack=True
+            )
+            
+            # Set QoS - keep the worker pool fed while messages are in flight
+            channel.basic_qos(prefetch_count=PREFETCH_COUNT)
+            
+            # Acks are batched per channel
+            acker = AckBatcher(connection, channel, publish_channel)
             
             # Start consuming
             channel.basic_consume(
                 queue=QUEUE_NAME,
-                on_message_callback=process_message,
+                on_message_callback=functools.partial(on_message, acker),
                 auto_ack=False
             )
             
             logger.info(f"✓ Push Service ready - waiting for messages on '{QUEUE_NAME}'...")
+            reconnect_attempt = 0
             channel.start_consuming()
             
         except KeyboardInterrupt:
+            # A second signal must not cut the drain short
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
             logger.info("Shutting down Push Service...")
+            if connection and connection.is_open:
+                try:
+                    # Stop new deliveries, then let in-flight ones finish
+                    channel.stop_consuming()
+                    drain_in_flight(connection, acker)
+                    connection.close()
+                except Exception as e:
+                    logger.error(f"Error during shutdown: {str(e)}")
+            executor.shutdown(wait=False, cancel_futures=True)
+            fetch_executor.shutdown(wait=False, cancel_futures=True)
             break
             
         except pika.exceptions.AMQPConnectionError as e:
             logger.error(f"RabbitMQ connection error: {str(e)}")
-            logger.info("Reconnecting in 5 seconds...")
-            time.sleep(5)
+            delay = reconnect_delay(reconnect_attempt)
+            reconnect_attempt += 1
+            logger.info(f"Reconnecting in {delay:.1f} seconds...")
+            time.sleep(delay)
             
         except Exception as e:
             logger.error(f"Consumer error: {str(e)}", exc_info=True)
-            logger.info("Reconnecting in 5 seconds...")
-            time.sleep(5)
+            delay = reconnect_delay(reconnect_attempt)
+            reconnect_attempt += 1
+            logger.info(f"Reconnecting in {delay:.1f} seconds...")
+            time.sleep(delay)
+
+
+def main():
+    """Run WORKER_COUNT independent consumer processes"""
+    if WORKER_COUNT <= 1:
+        start_consumer()
+        return
+    
+    # Spawn (not fork) so no sockets, threads or gRPC state leak into workers
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=start_consumer, name=f"push-consumer-{i + 1}")
+        for i in range(WORKER_COUNT)
+    ]
+    for worker in workers:
+        worker.start()
+    logger.info(f"Started {WORKER_COUNT} push consumer processes")
+    
+    # SIGTERM only reaches this process (PID 1 in the container); it is
+    # forwarded to the workers below
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    
+    alive = list(workers)
+    try:
+        while alive:
+            multiprocessing.connection.wait([worker.sentinel for worker in alive])
+            for worker in [worker for worker in alive if not worker.is_alive()]:
+                alive.remove(worker)
+                _join_worker(worker)
+    except KeyboardInterrupt:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        logger.info("Stopping push consumer processes...")
+        for worker in alive:
+            if worker.is_alive():
+                worker.terminate()  # SIGTERM: the worker drains, then exits
+        for worker in alive:
+            _join_worker(worker)
+
+
+def _join_worker(worker):
+    """Reap a worker process, logging it if it did not exit cleanly"""
+    worker.join()
+    if worker.exitcode != 0:
+        logger.error(f"Push consumer process {worker.name} exited with code {worker.exitcode}")
 
 
 if __name__ == "__main__":
-    start_consumer()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""AckBatcher behaviour with deliveries completing out of order."""
+import pytest
+
+import consumer
+
+
+class FakeConnection:
+    """Runs threadsafe callbacks when asked and holds timers instead of firing them."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.timers = []
+        self.delays = []
+
+    def add_callback_threadsafe(self, callback):
+        self.callbacks.append(callback)
+
+    def call_later(self, delay, callback):
+        self.timers.append(callback)
+        self.delays.append(delay)
+        return len(self.timers)
+
+    def run_callbacks(self):
+        while self.callbacks:
+            self.callbacks.pop(0)()
+
+    def fire_timers(self):
+        timers, self.timers = self.timers, []
+        for callback in timers:
+            callback()
+
+
+class FakeChannel:
+    is_open = True
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.acks = []
+        self.nacks = []
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.acks.append((delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag, requeue=False):
+        self.nacks.append((delivery_tag, requeue))
+
+
+@pytest.fixture
+def batcher(monkeypatch):
+    monkeypatch.setattr(consumer, "ACK_BATCH_SIZE", 1000)
+    connection = FakeConnection()
+    channel = FakeChannel(connection)
+    return consumer.AckBatcher(connection, channel, publish_channel=None)
+
+
+def complete(batcher, *tags):
+    for tag in tags:
+        batcher.ack(tag)
+    batcher.connection.run_callbacks()
+
+
+def test_in_order_completions_share_one_multiple_ack(batcher):
+    for tag in range(1, 6):
+        batcher.track(tag)
+    complete(batcher, 1, 2, 3, 4, 5)
+
+    batcher.flush()
+
+    assert batcher.channel.acks == [(5, True)]
+    assert batcher.in_flight() == 0
+    assert not batcher.unsettled
+
+
+def test_slow_delivery_does_not_hold_back_later_acks(batcher):
+    for tag in range(1, 51):
+        batcher.track(tag)
+    complete(batcher, *range(2, 51))
+
+    batcher.flush()
+
+    # Nothing below the gap to batch, so every completion is acked on its own
+    assert batcher.channel.acks == [(tag, False) for tag in range(2, 51)]
+    assert batcher.unsettled == {1}
+    assert batcher.in_flight() == 1
+
+    complete(batcher, 1)
+    batcher.flush()
+
+    assert batcher.channel.acks[-1] == (1, False)
+    assert not batcher.unsettled
+
+
+def test_prefix_is_batched_and_tags_above_the_gap_are_acked_individually(batcher):
+    for tag in range(1, 8):
+        batcher.track(tag)
+    complete(batcher, 1, 2, 3, 5, 7)
+
+    batcher.flush()
+
+    assert batcher.channel.acks == [(3, True), (5, False), (7, False)]
+    assert batcher.unsettled == {4, 6}
+
+
+def test_timer_flushes_out_of_order_completions(batcher):
+    for tag in range(1, 4):
+        batcher.track(tag)
+    complete(batcher, 3)
+
+    batcher.connection.fire_timers()
+
+    assert batcher.channel.acks == [(3, False)]
+    assert batcher.unsettled == {1, 2}
+    assert batcher.connection.timers == []
+
+
+def test_nacked_delivery_does_not_block_the_batch(batcher):
+    for tag in range(1, 4):
+        batcher.track(tag)
+    batcher.nack(1)
+    complete(batcher, 2, 3)
+
+    batcher.flush()
+
+    assert batcher.channel.nacks == [(1, False)]
+    assert batcher.channel.acks == [(3, True)]
+
+
+def test_failed_publish_requeues_after_a_growing_backoff(batcher):
+    for tag in range(1, 3):
+        batcher.track(tag)
+
+    batcher.ack_after_publish(1, lambda channel: False)
+    batcher.connection.run_callbacks()
+
+    # Not requeued straight away, so a refusing broker is not hot-looped
+    assert batcher.channel.nacks == []
+    assert batcher.in_flight() == 2
+
+    batcher.connection.fire_timers()
+    assert batcher.channel.nacks == [(1, True)]
+
+    batcher.ack_after_publish(2, lambda channel: False)
+    batcher.connection.run_callbacks()
+    assert batcher.connection.delays[-1] > batcher.connection.delays[0]
+
+
+def test_successful_publish_acks_and_resets_the_backoff(batcher):
+    for tag in range(1, 3):
+        batcher.track(tag)
+
+    batcher.ack_after_publish(1, lambda channel: False)
+    batcher.ack_after_publish(2, lambda channel: True)
+    batcher.connection.run_callbacks()
+    batcher.flush()
+
+    assert batcher.channel.acks == [(2, False)]
+    assert batcher.publish_failures == 0
@@ -0,0 +1,112 @@
+"""DeliveredFilter generations and the redelivery-only dedupe in process_message."""
+import types
+
+import orjson
+import pytest
+
+import consumer
+
+
+def expire_generation(delivered_filter):
+    """Move the filter's clock back so the next access rotates it."""
+    delivered_filter.rotated_at -= delivered_filter.rotate_interval
+
+
+def test_key_is_remembered_for_one_rotation_then_forgotten():
+    delivered_filter = consumer.DeliveredFilter(rotate_interval=60)
+    delivered_filter.add("n-1:0")
+    assert "n-1:0" in delivered_filter
+
+    # First rotation: the entry moves to the previous generation
+    expire_generation(delivered_filter)
+    assert "n-1:0" in delivered_filter
+
+    # Second rotation: the generation holding it is dropped
+    expire_generation(delivered_filter)
+    assert "n-1:0" not in delivered_filter
+
+
+def test_entries_added_after_a_rotation_land_in_the_new_generation():
+    delivered_filter = consumer.DeliveredFilter(rotate_interval=60)
+    delivered_filter.add("old:0")
+    expire_generation(delivered_filter)
+    delivered_filter.add("new:0")
+
+    expire_generation(delivered_filter)
+
+    assert "old:0" not in delivered_filter
+    assert "new:0" in delivered_filter
+
+
+def test_no_rotation_before_the_interval():
+    delivered_filter = consumer.DeliveredFilter(rotate_interval=60)
+    current = delivered_filter.current
+    delivered_filter.add("n-1:0")
+
+    assert "n-1:0" in delivered_filter
+    assert delivered_filter.current is current
+
+
+class RecordingAcker:
+    def __init__(self):
+        self.acked = []
+        self.nacked = []
+
+    def ack(self, delivery_tag):
+        self.acked.append(delivery_tag)
+
+    def nack(self, delivery_tag):
+        self.nacked.append(delivery_tag)
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Replace the FCM send with a recorder and start from an empty filter."""
+    calls = []
+    monkeypatch.setattr(consumer, "delivered", consumer.DeliveredFilter())
+    monkeypatch.setattr(
+        consumer, "send_push_notification_fcm", lambda **kwargs: calls.append(kwargs)
+    )
+    return calls
+
+
+def deliver(redelivered, acker, notification_id="n-1"):
+    body = orjson.dumps({
+        "notification_id": notification_id,
+        "user_id": "u-1",
+        "push_token": "token",
+        "rendered": {"title": "Hi", "body": "Hello"},
+    })
+    method = types.SimpleNamespace(delivery_tag=1, redelivered=redelivered)
+    properties = types.SimpleNamespace(headers=None)
+    consumer.process_message(None, method, properties, body, acker)
+
+
+def test_redelivered_duplicate_is_dropped(sent):
+    consumer.delivered.add("n-1:0")
+    acker = RecordingAcker()
+
+    deliver(redelivered=True, acker=acker)
+
+    assert sent == []
+    assert acker.acked == [1]
+
+
+def test_first_delivery_is_sent_even_if_the_filter_matches(sent):
+    # A bloom false positive must never drop a first delivery
+    consumer.delivered.add("n-1:0")
+    acker = RecordingAcker()
+
+    deliver(redelivered=False, acker=acker)
+
+    assert len(sent) == 1
+    assert acker.acked == []
+
+
+def test_redelivery_that_was_never_delivered_is_sent(sent):
+    acker = RecordingAcker()
+
+    deliver(redelivered=True, acker=acker)
+
+    assert len(sent) == 1
+    assert acker.acked == []
@@ -0,0 +1,136 @@
+"""FcmBatchSender reports every delivery, even when a batch fails unexpectedly."""
+import threading
+import types
+
+import pytest
+
+import consumer
+
+
+class Response:
+    def __init__(self, success, exception=None):
+        self.success = success
+        self.message_id = "msg-id" if success else None
+        self.exception = exception
+
+
+class ImmediateExecutor:
+    """Runs submitted callbacks inline so results are visible straight away."""
+
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class ShutDownExecutor:
+    def submit(self, fn, *args):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+
+def fake_messaging(send_each):
+    return types.SimpleNamespace(
+        send_each=send_each,
+        UnregisteredError=type("UnregisteredError", (Exception,), {}),
+        SenderIdMismatchError=type("SenderIdMismatchError", (Exception,), {}),
+    )
+
+
+def make_batch(size):
+    results = {}
+    batch = [
+        (f"message-{i}", f"token-{i}", lambda success, i=i: results.__setitem__(i, success))
+        for i in range(size)
+    ]
+    return batch, results
+
+
+@pytest.fixture(autouse=True)
+def immediate_executor(monkeypatch):
+    monkeypatch.setattr(consumer, "executor", ImmediateExecutor())
+
+
+def test_results_are_reported_per_message(monkeypatch):
+    monkeypatch.setattr(consumer, "messaging", fake_messaging(
+        lambda messages: types.SimpleNamespace(
+            responses=[Response(i % 2 == 0, RuntimeError("x")) for i in range(len(messages))]
+        )
+    ))
+    batch, results = make_batch(4)
+
+    consumer.FcmBatchSender()._flush(batch)
+
+    assert results == {0: True, 1: False, 2: True, 3: False}
+
+
+def test_failing_send_each_fails_every_message(monkeypatch):
+    def send_each(messages):
+        raise ConnectionError("FCM unreachable")
+
+    monkeypatch.setattr(consumer, "messaging", fake_messaging(send_each))
+    batch, results = make_batch(3)
+
+    consumer.FcmBatchSender()._flush(batch)
+
+    assert results == {0: False, 1: False, 2: False}
+
+
+def test_error_while_handling_results_still_reports_every_message(monkeypatch):
+    # A result object without the expected attributes breaks result handling
+    monkeypatch.setattr(consumer, "messaging", fake_messaging(
+        lambda messages: types.SimpleNamespace(responses=[object() for _ in messages])
+    ))
+    batch, results = make_batch(3)
+
+    consumer.FcmBatchSender()._flush(batch)
+
+    assert results == {0: False, 1: False, 2: False}
+
+
+def test_short_response_list_fails_the_rest(monkeypatch):
+    monkeypatch.setattr(consumer, "messaging", fake_messaging(
+        lambda messages: types.SimpleNamespace(responses=[Response(True)])
+    ))
+    batch, results = make_batch(3)
+
+    consumer.FcmBatchSender()._flush(batch)
+
+    assert results == {0: True, 1: False, 2: False}
+
+
+def test_results_are_reported_after_worker_pool_shutdown(monkeypatch):
+    monkeypatch.setattr(consumer, "executor", ShutDownExecutor())
+    monkeypatch.setattr(consumer, "messaging", fake_messaging(
+        lambda messages: types.SimpleNamespace(responses=[Response(True) for _ in messages])
+    ))
+    batch, results = make_batch(2)
+
+    consumer.FcmBatchSender()._flush(batch)
+
+    assert results == {0: True, 1: True}
+
+
+def test_flush_thread_survives_a_failed_batch(monkeypatch):
+    calls = []
+
+    def send_each(messages):
+        calls.append(len(messages))
+        if len(calls) == 1:
+            return types.SimpleNamespace(responses=[object() for _ in messages])
+        return types.SimpleNamespace(responses=[Response(True) for _ in messages])
+
+    monkeypatch.setattr(consumer, "messaging", fake_messaging(send_each))
+    sender = consumer.FcmBatchSender(batch_size=1, flush_interval=0.01)
+    sender.start()
+
+    outcomes = []
+    done = threading.Event()
+
+    def on_result(success):
+        outcomes.append(success)
+        if len(outcomes) == 2:
+            done.set()
+
+    sender.submit("first", "token-1", on_result)
+    sender.submit("second", "token-2", on_result)
+
+    assert done.wait(timeout=2)
+    assert outcomes == [False, True]
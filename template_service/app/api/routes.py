@@ -16,9 +16,9 @@ from aio_pika.channel import Channel
 from typing import List
 
 from app import crud, schemas
+from app.core.exceptions import TemplateDuplicateError
 from app.database import get_session
 from app.dependencies import get_redis, get_rabbit_channel
-from services.cache import cache_service
 from services.messaging import messaging_service
 
 router = APIRouter(prefix="/templates", tags=["Templates"])
@@ -36,20 +36,17 @@ async def create_template(
     """
     Create a new template.
 
-    - Checks if a template with this name already exists.
-    - If not, creates it with version 1.
+    - Creates it with version 1, unless a template with this name
+      already exists (checked by the insert itself).
     """
-    existing_template = await crud.get_template_by_name(
-        db, name=template.name, language=template.language
-    )
-    if existing_template:
+    try:
+        new_template = await crud.create_template(db=db, template=template)
+    except TemplateDuplicateError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Template with name '{template.name}' and language '{template.language}' already exists.",
         )
 
-    new_template = await crud.create_template(db=db, template=template)
-
     return schemas.BaseResponse(
         success=True,
         message="Template created successfully.",
@@ -71,22 +68,11 @@ async def get_latest_template(
     """
     Get the *latest version* of a template by its unique name.
 
-    - Implements Cache-Aside pattern.
+    - Served through the read-through cache in crud.
     - 1. Check Redis cache.
-    - 2. If miss, get from PostgreSQL.
-    - 3. After DB fetch, store result in Redis for next time.
+    - 2. If miss, get from PostgreSQL and store the result in Redis.
     """
-    # 1. Check Redis cache
-    cached_template = await cache_service.get_template_cache(name, language)
-    if cached_template:
-        return schemas.BaseResponse(
-            success=True,
-            message="Template retrieved successfully (from cache).",
-            data=cached_template,
-        )
-
-    # 2. If miss, get from PostgreSQL
-    template = await crud.get_template_by_name(
+    template = await crud.get_template_by_name_cached(
         db, name=name, language=language
     )
 
@@ -96,15 +82,10 @@ async def get_latest_template(
             detail=f"Template with name '{name}' and language '{language}' not found.",
         )
 
-    # 3. Store in Redis for next time
-    # Convert SQLAlchemy model to Pydantic model for caching
-    public_template = schemas.TemplatePublic.model_validate(template)
-    await cache_service.set_template_cache(public_template)
-
     return schemas.BaseResponse(
         success=True,
-        message="Template retrieved successfully (from database).",
-        data=public_template,
+        message="Template retrieved successfully.",
+        data=template,
     )
 
 
@@ -126,7 +107,7 @@ async def update_template(
 
     - 1. Finds the latest version in DB.
     - 2. Creates a new version row in DB.
-    - 3. Clears the local Redis cache.
+    - 3. Clears the local Redis cache (done by crud on commit).
     - 4. Publishes an invalidation message to RabbitMQ.
     """
     # 1. Find the latest version
@@ -141,12 +122,17 @@ async def update_template(
         )
 
     # 2. Create a new version
-    new_version = await crud.create_new_template_version(
-        db=db, latest_template=latest_template, template_update=template_update
-    )
+    try:
+        new_version = await crud.create_new_template_version(
+            db=db, latest_template=latest_template, template_update=template_update
+        )
+    except TemplateDuplicateError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Template '{name}' was updated concurrently. Retry the update.",
+        )
 
-    # 3. Clear the local Redis cache
-    await cache_service.clear_template_cache(name, language)
+    # 3. Local Redis cache is cleared by create_new_template_version
 
     # 4. Publish invalidation message to RabbitMQ
     await messaging_service.publish_template_update_message(
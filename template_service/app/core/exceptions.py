@@ -5,80 +5,89 @@ from typing import Optional, Any, Dict
 
 
 class TemplateServiceException(Exception):
-    """Base exception for Template Service."""
+    """
+    Base exception for Template Service.
+
+    Subclasses only set status_code and default_message; error_code is the
+    class name, assigned once when the subclass is defined.
+    """
+
+    status_code: int = 500
+    default_message: str = "Template service error"
+    error_code: str = "TemplateServiceException"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.error_code = cls.__name__
 
     def __init__(
         self,
-        message: str,
-        status_code: int = 500,
-        error_code: Optional[str] = None,
+        message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        self.message = message
-        self.status_code = status_code
-        self.error_code = error_code or self.__class__.__name__
-        self.details = details or {}
+        self.message = message or self.default_message
+        self.details = details if details is not None else {}
         super().__init__(self.message)
 
 
 class TemplateNotFoundError(TemplateServiceException):
     """Raised when a template is not found."""
 
-    def __init__(self, message: str = "Template not found", details: Optional[Dict] = None):
-        super().__init__(message, status_code=404, details=details)
+    status_code = 404
+    default_message = "Template not found"
 
 
 class TemplateDuplicateError(TemplateServiceException):
     """Raised when attempting to create a duplicate template."""
 
-    def __init__(self, message: str = "Template already exists", details: Optional[Dict] = None):
-        super().__init__(message, status_code=409, details=details)
+    status_code = 409
+    default_message = "Template already exists"
 
 
 class InvalidTemplateError(TemplateServiceException):
     """Raised when template data is invalid."""
 
-    def __init__(self, message: str = "Invalid template data", details: Optional[Dict] = None):
-        super().__init__(message, status_code=400, details=details)
+    status_code = 400
+    default_message = "Invalid template data"
 
 
 class VariableSubstitutionError(TemplateServiceException):
     """Raised when variable substitution fails."""
 
-    def __init__(self, message: str = "Variable substitution failed", details: Optional[Dict] = None):
-        super().__init__(message, status_code=400, details=details)
+    status_code = 400
+    default_message = "Variable substitution failed"
 
 
 class CacheError(TemplateServiceException):
     """Raised when cache operation fails."""
 
-    def __init__(self, message: str = "Cache operation failed", details: Optional[Dict] = None):
-        super().__init__(message, status_code=503, details=details)
+    status_code = 503
+    default_message = "Cache operation failed"
 
 
 class MessagingError(TemplateServiceException):
     """Raised when messaging operation fails."""
 
-    def __init__(self, message: str = "Messaging operation failed", details: Optional[Dict] = None):
-        super().__init__(message, status_code=503, details=details)
+    status_code = 503
+    default_message = "Messaging operation failed"
 
 
 class DatabaseError(TemplateServiceException):
     """Raised when database operation fails."""
 
-    def __init__(self, message: str = "Database operation failed", details: Optional[Dict] = None):
-        super().__init__(message, status_code=503, details=details)
+    status_code = 503
+    default_message = "Database operation failed"
 
 
 class ValidationError(TemplateServiceException):
     """Raised when validation fails."""
 
-    def __init__(self, message: str = "Validation failed", details: Optional[Dict] = None):
-        super().__init__(message, status_code=422, details=details)
+    status_code = 422
+    default_message = "Validation failed"
 
 
 class CircuitBreakerOpenError(TemplateServiceException):
     """Raised when circuit breaker is open."""
 
-    def __init__(self, message: str = "Service temporarily unavailable", details: Optional[Dict] = None):
-        super().__init__(message, status_code=503, details=details)
+    status_code = 503
+    default_message = "Service temporarily unavailable"
@@ -2,45 +2,69 @@
 Logging configuration with support for JSON and text formats.
 """
 import logging
-import json
 import sys
-from datetime import datetime
-from typing import Any, Dict
-from pythonjsonlogger import jsonlogger
-from app.core.config import settings
+import time
+import orjson
+from app.core.config import get_settings
+from app.utils.correlation_id import correlation_id_var
+
+# Thread/process names are not part of either log format
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 
 class CorrelationIDFilter(logging.Filter):
     """Add correlation ID to logs for request tracing."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        # This will be set by middleware
-        if not hasattr(record, 'correlation_id'):
-            record.correlation_id = "N/A"
+        # An id passed explicitly via extra= wins; otherwise read straight from
+        # the request's context, set by set_correlation_id()
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id_var.get() or "N/A"
         return True
 
 
+# One filter shared by every handler
+_FILTER = CorrelationIDFilter()
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Format each record as a single JSON object, serialized with orjson."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "name": record.name,
+            "correlation_id": getattr(record, "correlation_id", "N/A"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log_record["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(log_record).decode()
+
+
 def setup_logging() -> None:
     """Configure application logging."""
+    settings = get_settings()
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.LOG_LEVEL)
 
+    # SQL statements are only logged when SQL_ECHO=1 turns on engine echo
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Add correlation filter
-    correlation_filter = CorrelationIDFilter()
-
     if settings.LOG_FORMAT == "json":
         # JSON Logging
         handler = logging.StreamHandler(sys.stdout)
-        formatter = jsonlogger.JsonFormatter(
-            fmt='%(timestamp)s %(level)s %(name)s %(correlation_id)s %(message)s',
-            timestamp=True
-        )
+        formatter = OrjsonFormatter()
         handler.setFormatter(formatter)
-        handler.addFilter(correlation_filter)
+        handler.addFilter(_FILTER)
         root_logger.addHandler(handler)
     else:
         # Text Logging
@@ -50,7 +74,7 @@ def setup_logging() -> None:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         handler.setFormatter(formatter)
-        handler.addFilter(correlation_filter)
+        handler.addFilter(_FILTER)
         root_logger.addHandler(handler)
 
 
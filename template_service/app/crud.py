@@ -1,8 +1,17 @@
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc
+from sqlalchemy import desc, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app import models, schemas  # <-- Use absolute import
-from typing import Optional
+from app.core.exceptions import TemplateDuplicateError
+from services.cache import cache_service
+from typing import Any, Dict, Optional, Tuple
+
+# Cache misses currently being loaded, keyed by (name, language). Concurrent
+# requests for the same template wait on the first one's query instead of
+# each running their own.
+_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
 
 async def get_template_by_name(
     db: AsyncSession, 
@@ -13,14 +22,127 @@ async def get_template_by_name(
     Fetches the single *latest version* of a template by its name
     and language from the database.
     """
+    # lambda_stmt caches the compiled SQL; later calls only rebind name/language
     query = (
-        select(models.Template)
-        .filter(models.Template.name == name, models.Template.language == language)
-        .order_by(desc(models.Template.version))
-        .limit(1)
+        lambda_stmt(lambda: select(models.Template))
+        + (lambda s: s.where(models.Template.name == name, models.Template.language == language))
+        + (lambda s: s.order_by(desc(models.Template.version)).limit(1))
     )
     result = await db.execute(query)
-    return result.scalars().first()
+    return result.scalar_one_or_none()
+
+# Same query as get_template_by_name, for the raw asyncpg read path.
+# asyncpg prepares it once per connection and reuses the plan.
+_LATEST_TEMPLATE_SQL = (
+    "SELECT id, name, type, language, subject, body, version, created_at, updated_at "
+    "FROM templates WHERE name = $1 AND language = $2 "
+    "ORDER BY version DESC LIMIT 1"
+)
+
+async def get_template_by_name_fast(
+    db: AsyncSession, 
+    name: str, 
+    language: str = "en"
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetches the latest version of a template as a plain dict, running the
+    query on the session's asyncpg connection directly. Skips the ORM
+    (no identity map, no Row -> model conversion) for read-only callers.
+    """
+    conn = await db.connection()
+    raw_connection = await conn.get_raw_connection()
+    record = await raw_connection.driver_connection.fetchrow(_LATEST_TEMPLATE_SQL, name, language)
+    if record is None:
+        return None
+
+    template = dict(record)
+    # The enum column stores member names (EMAIL/PUSH), as SQLAlchemy writes them
+    template["type"] = models.TemplateTypeDB[template["type"]]
+    return template
+
+async def get_template_by_name_cached(
+    db: AsyncSession, 
+    name: str, 
+    language: str = "en"
+) -> Optional[schemas.TemplatePublic]:
+    """
+    Read-through cache in front of get_template_by_name.
+    Returns the public schema rather than the ORM row, so cache hits and
+    misses look the same to the caller and nothing is tied to the session.
+    That also lets concurrent misses for one template share a single query.
+    """
+    cached_template = await cache_service.get_template_cache(name, language)
+    if cached_template:
+        return cached_template
+
+    key = (name, language)
+    while True:
+        pending = _inflight.get(key)
+        if pending is None:
+            break
+        try:
+            # shield: a waiter being cancelled must not cancel the shared load
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # this waiter itself was cancelled
+            # The leader was cancelled (e.g. its client disconnected), not us:
+            # join a newer load or run our own instead of failing
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        public_template = await _load_public_template(db, name, language)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # retrieved, even if nobody else was waiting
+        raise
+    else:
+        future.set_result(public_template)
+        return public_template
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+async def _load_public_template(
+    db: AsyncSession, 
+    name: str, 
+    language: str
+) -> Optional[schemas.TemplatePublic]:
+    """Loads a template from the database and stores it in the cache."""
+    template = await get_template_by_name_fast(db, name=name, language=language)
+    if not template:
+        return None
+
+    public_template = schemas.TemplatePublic.model_validate(template)
+    await cache_service.set_template_cache(public_template)
+    return public_template
+
+async def _insert_template_version(db: AsyncSession, **values) -> models.Template:
+    """
+    Inserts one template row and returns it, in a single round-trip.
+    Raises TemplateDuplicateError if (name, language, version) already exists.
+    """
+    query = (
+        pg_insert(models.Template)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["name", "language", "version"])
+        .returning(models.Template)
+    )
+    result = await db.execute(query)
+    db_template = result.scalar_one_or_none()
+    if db_template is None:
+        raise TemplateDuplicateError(
+            f"Template '{values['name']}' ({values['language']}) version {values['version']} already exists"
+        )
+
+    await db.commit()
+    # The cached copy (if any) is now an old version
+    await cache_service.clear_template_cache(db_template.name, db_template.language)
+    return db_template
 
 async def create_template(
     db: AsyncSession, 
@@ -28,17 +150,13 @@ async def create_template(
 ) -> models.Template:
     """
     Creates a new template in the database, starting at version 1.
+    Raises TemplateDuplicateError if the template already exists.
     """
-    # Create the SQLAlchemy model instance from the Pydantic schema
-    db_template = models.Template(
+    return await _insert_template_version(
+        db,
         **template.model_dump(),
         version=1  # Always start at version 1
     )
-    
-    db.add(db_template)
-    await db.commit()
-    await db.refresh(db_template)
-    return db_template
 
 async def create_new_template_version(
     db: AsyncSession, 
@@ -48,9 +166,10 @@ async def create_new_template_version(
     """
     Creates a new version of an existing template by incrementing
     the version number and copying the data.
+    Raises TemplateDuplicateError if a concurrent update created it first.
     """
-    # Create a new Template object for the new version
-    new_version_template = models.Template(
+    return await _insert_template_version(
+        db,
         name=latest_template.name,
         type=latest_template.type,
         language=latest_template.language,
@@ -59,8 +178,3 @@ async def create_new_template_version(
         body=template_update.body if template_update.body is not None else latest_template.body,
         version=latest_template.version + 1  # Increment the version
     )
-    
-    db.add(new_version_template)
-    await db.commit()
-    await db.refresh(new_version_template)
-    return new_version_template
\ No newline at end of file
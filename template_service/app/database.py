@@ -9,24 +9,44 @@ This module handles:
 """
 
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.models import Base
 
 # Database URL from environment variables
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql+asyncpg://user:password@db/template_db")
 
+# Connection pool sizing
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+
+# asyncpg prepared statement cache per connection; set to 0 behind pgbouncer
+# (transaction pooling cannot keep prepared statements across transactions)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+# SQLAlchemy's asyncpg adapter cache of prepared statement handles (same caveat)
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "512"))
+
 # Create the async engine
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,  # Log SQL queries (development)
+    echo=os.getenv("SQL_ECHO") == "1",  # Log SQL queries (development only)
+    poolclass=AsyncAdaptedQueuePool,  # asyncio-safe pool for asyncpg
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,  # discard connections the server has closed
+    pool_recycle=DB_POOL_RECYCLE,
+    query_cache_size=1200,  # compiled statement cache (default 500)
+    connect_args={
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": DB_PREPARED_STATEMENT_CACHE_SIZE,
+    },
     future=True
 )
 
 # Create async session factory
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
+AsyncSessionLocal = async_sessionmaker(
+    engine,
     expire_on_commit=False,
     autoflush=False,
 )
@@ -34,7 +54,7 @@ AsyncSessionLocal = sessionmaker(
 async def get_session() -> AsyncSession:
     """
     Dependency to get an async database session.
-    Ensures the session is always closed.
+    The session is closed when the context manager exits.
     """
     async with AsyncSessionLocal() as session:
         try:
@@ -42,8 +62,6 @@ async def get_session() -> AsyncSession:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 async def create_db_and_tables():
     """
@@ -6,12 +6,24 @@ database sessions, cache connections, and message queue channels
 into route handlers.
 """
 
+from typing import Optional
 from fastapi import HTTPException, Request
 from redis.asyncio import Redis
 from aio_pika.channel import Channel
 from app.database import get_session  # Re-export database session
 
-__all__ = ["get_session", "get_redis", "get_rabbit_channel"]
+__all__ = ["get_session", "get_redis", "get_rabbit_channel", "set_connections"]
+
+# Set once by the lifespan after startup, so dependencies skip app.state
+_redis: Optional[Redis] = None
+_rabbit_channel: Optional[Channel] = None
+
+
+def set_connections(redis: Optional[Redis], rabbit_channel: Optional[Channel]) -> None:
+    """Publish the connections opened at startup (None on shutdown)."""
+    global _redis, _rabbit_channel
+    _redis = redis
+    _rabbit_channel = rabbit_channel
 
 
 async def get_redis(request: Request) -> Redis:
@@ -21,12 +33,13 @@ async def get_redis(request: Request) -> Redis:
     Raises:
         HTTPException: If Redis is not available
     """
-    if not hasattr(request.app.state, "redis") or not request.app.state.redis:
+    redis = _redis if _redis is not None else getattr(request.app.state, "redis", None)
+    if redis is None:
         raise HTTPException(
             status_code=503,
             detail="Redis connection not available."
         )
-    return request.app.state.redis
+    return redis
 
 
 async def get_rabbit_channel(request: Request) -> Channel:
@@ -36,10 +49,10 @@ async def get_rabbit_channel(request: Request) -> Channel:
     Raises:
         HTTPException: If RabbitMQ is not available
     """
-    if not hasattr(request.app.state, "rabbit_channel") or not request.app.state.rabbit_channel:
+    channel = _rabbit_channel if _rabbit_channel is not None else getattr(request.app.state, "rabbit_channel", None)
+    if channel is None:
         raise HTTPException(
             status_code=503,
             detail="RabbitMQ connection not available."
         )
-    return request.app.state.rabbit_channel
-
+    return channel
@@ -10,20 +10,23 @@ This module configures the FastAPI app with:
 """
 
 from fastapi import FastAPI, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import HTTPException
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import orjson
 
+from app.core.logging_config import setup_logging
 from app.database import create_db_and_tables, close_db_connection
 from app.schemas import BaseResponse
-from app.dependencies import get_redis, get_rabbit_channel
+from app.dependencies import get_redis, get_rabbit_channel, set_connections
 from app.api import router as api_router
 from services.cache import cache_service
 from services.messaging import messaging_service
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging (LOG_LEVEL/LOG_FORMAT; keeps sqlalchemy.engine at WARNING)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -45,22 +48,34 @@ async def lifespan(app: FastAPI):
         # Store connections in app.state for dependencies
         app.state.redis = await cache_service.get_connection()
         app.state.rabbit_channel = await messaging_service.get_channel()
+        if app.state.redis is None or app.state.rabbit_channel is None:
+            raise RuntimeError("Redis or RabbitMQ connection is not available")
+        set_connections(app.state.redis, app.state.rabbit_channel)
 
-    except Exception as e:
-        logger.error(f"Failed during startup: {e}")
+    except Exception:
+        # Refuse to start rather than serve 503s for every request
+        logger.exception("Failed during startup")
+        raise
 
     yield  # The application is now running
 
     # On shutdown:
     logger.info("Shutting down Template Service...")
-    if hasattr(app.state, "redis") and app.state.redis:
-        await app.state.redis.close()
-    if hasattr(app.state, "rabbit_channel") and app.state.rabbit_channel:
-        await app.state.rabbit_channel.close()
-
-    await close_db_connection()
-    await cache_service.close_redis_pool()
-    await messaging_service.close_rabbitmq_connection()
+    set_connections(None, None)
+    redis = getattr(app.state, "redis", None)
+    channel = getattr(app.state, "rabbit_channel", None)
+    await asyncio.gather(
+        *(conn.close() for conn in (redis, channel) if conn is not None),
+        return_exceptions=True,
+    )
+
+    # Pools are independent of each other, so close them together
+    await asyncio.gather(
+        close_db_connection(),
+        cache_service.close_redis_pool(),
+        messaging_service.close_rabbitmq_connection(),
+        return_exceptions=True,
+    )
     logger.info("Shutdown complete.")
 
 
@@ -70,19 +85,20 @@ app = FastAPI(
     description="Manages email and push notification templates for the HNG Distributed Notification System.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # --- Custom Exception Handler ---
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Custom exception handler for HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=BaseResponse(
             success=False,
             message="An error occurred.",
             error=exc.detail,
-        ).model_dump(),
+        ).model_dump(exclude_none=True),
     )
 
 
@@ -93,12 +109,34 @@ app.include_router(
 )
 
 
-@app.get("/health", response_model=BaseResponse, tags=["Monitoring"])
+# The health response never changes, so it is serialized once
+_HEALTHY_BODY = orjson.dumps(
+    BaseResponse(
+        success=True,
+        message="Template Service is healthy and running.",
+    ).model_dump()
+)
+
+
+@app.get("/health", tags=["Monitoring"])
 async def health_check():
     """
     Health check endpoint required by the HNG spec.
     """
-    return BaseResponse(
-        success=True,
-        message="Template Service is healthy and running.",
+    return Response(content=_HEALTHY_BODY, media_type="application/json")
+
+
+if __name__ == "__main__":
+    import os
+    import uvicorn
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        loop="uvloop",  # libuv event loop
+        http="httptools",  # C HTTP parser instead of h11
+        workers=os.cpu_count(),
     )
@@ -29,6 +29,8 @@ class Template(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     __table_args__ = (
+        # Also serves the "latest version" lookup: PostgreSQL scans it backward
+        # for ORDER BY version DESC LIMIT 1
         Index('idx_name_lang_version', 'name', 'language', 'version', unique=True),
     )
 
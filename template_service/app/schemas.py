@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Generic, TypeVar, Optional, List
 from datetime import datetime
 import enum
@@ -53,9 +53,8 @@ class TemplateBase(BaseModel):
     subject: Optional[str] = None
     body: str
 
-    class Config:
-        # This allows Pydantic to read data from ORM models
-        from_attributes = True
+    # from_attributes allows Pydantic to read data from ORM models
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 
 class TemplateCreate(TemplateBase):
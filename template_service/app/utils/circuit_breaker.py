@@ -17,6 +17,11 @@ class CircuitBreakerState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
+# Internal state codes; CircuitBreaker.state maps them back to the enum
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATES = (CircuitBreakerState.CLOSED, CircuitBreakerState.OPEN, CircuitBreakerState.HALF_OPEN)
+
+
 class CircuitBreaker:
     """Circuit breaker pattern implementation."""
 
@@ -31,14 +36,19 @@ class CircuitBreaker:
         self.name = name
         self.failure_count = 0
         self.last_failure_time = None
-        self.state = CircuitBreakerState.CLOSED
+        self._state = _CLOSED
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        """Current state of the circuit."""
+        return _STATES[self._state]
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection."""
-        if self.state == CircuitBreakerState.OPEN:
+        if self._state == _OPEN:
             if self._should_attempt_reset():
-                self.state = CircuitBreakerState.HALF_OPEN
-                logger.info(f"{self.name}: Attempting recovery")
+                self._state = _HALF_OPEN
+                logger.info("%s: Attempting recovery", self.name)
             else:
                 raise CircuitBreakerOpenError(
                     f"{self.name}: Circuit breaker is open"
@@ -54,9 +64,9 @@ class CircuitBreaker:
 
     def _on_success(self) -> None:
         """Handle successful call."""
-        if self.state == CircuitBreakerState.HALF_OPEN:
-            logger.info(f"{self.name}: Recovery successful, closing circuit")
-            self.state = CircuitBreakerState.CLOSED
+        if self._state != _CLOSED:
+            logger.info("%s: Recovery successful, closing circuit", self.name)
+            self._state = _CLOSED
         self.failure_count = 0
 
     def _on_failure(self) -> None:
@@ -64,12 +74,12 @@ class CircuitBreaker:
         self.failure_count += 1
         self.last_failure_time = time.time()
         logger.warning(
-            f"{self.name}: Failure {self.failure_count}/{self.failure_threshold}"
+            "%s: Failure %d/%d", self.name, self.failure_count, self.failure_threshold
         )
 
         if self.failure_count >= self.failure_threshold:
-            self.state = CircuitBreakerState.OPEN
-            logger.error(f"{self.name}: Circuit breaker opened")
+            self._state = _OPEN
+            logger.error("%s: Circuit breaker opened", self.name)
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt recovery."""
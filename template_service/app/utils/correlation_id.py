@@ -1,7 +1,7 @@
 """
 Correlation ID tracking for distributed tracing.
 """
-import uuid
+import secrets
 from typing import Optional
 from contextvars import ContextVar
 
@@ -12,7 +12,7 @@ def get_correlation_id() -> str:
     """Get current correlation ID or generate new one."""
     correlation_id = correlation_id_var.get()
     if not correlation_id:
-        correlation_id = str(uuid.uuid4())
+        correlation_id = generate_correlation_id()
         correlation_id_var.set(correlation_id)
     return correlation_id
 
@@ -23,5 +23,5 @@ def set_correlation_id(correlation_id: str) -> None:
 
 
 def generate_correlation_id() -> str:
-    """Generate new correlation ID."""
-    return str(uuid.uuid4())
+    """Generate new correlation ID (64 random bits, hex encoded)."""
+    return secrets.token_hex(8)
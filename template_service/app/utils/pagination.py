@@ -1,39 +1,37 @@
 """
 Pagination utilities.
 """
-from typing import Generic, TypeVar, List, Dict, Any
+from functools import lru_cache
+from typing import Generic, TypeVar, List, Tuple
 from pydantic import BaseModel
+from app.schemas import PaginationMeta
 
 T = TypeVar('T')
 
 
-class PaginationMeta(BaseModel):
-    """Pagination metadata."""
-    total: int
-    limit: int
-    page: int
-    total_pages: int
-    has_next: bool
-    has_previous: bool
-
-
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response."""
     data: List[T]
     meta: PaginationMeta
 
 
+@lru_cache(maxsize=1024)
+def _meta_fields(total: int, page: int, limit: int) -> Tuple[int, int, int, int, bool, bool]:
+    """(total, limit, page, total_pages, has_next, has_previous) for a page."""
+    total_pages = -(-total // limit)  # Ceiling division
+    return total, limit, page, total_pages, page < total_pages, page > 1
+
+
 def calculate_pagination_meta(
     total: int,
     page: int,
     limit: int
 ) -> PaginationMeta:
     """Calculate pagination metadata."""
-    total_pages = (total + limit - 1) // limit  # Ceiling division
-    has_next = page < total_pages
-    has_previous = page > 1
+    total, limit, page, total_pages, has_next, has_previous = _meta_fields(total, page, limit)
 
-    return PaginationMeta(
+    # Fields are computed above, so validation can be skipped
+    return PaginationMeta.model_construct(
         total=total,
         limit=limit,
         page=page,
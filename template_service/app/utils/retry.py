@@ -41,15 +41,16 @@ async def retry_with_backoff(
             
             if attempt == max_retries:
                 logger.error(
-                    f"{func.__name__} failed after {max_retries + 1} attempts: {str(e)}"
+                    "%s failed after %d attempts: %s",
+                    func.__name__, max_retries + 1, e
                 )
                 raise
 
             # Calculate exponential backoff delay
             delay = min(base_delay * (2 ** attempt), max_delay)
             logger.warning(
-                f"{func.__name__} attempt {attempt + 1} failed: {str(e)}. "
-                f"Retrying in {delay}s..."
+                "%s attempt %d failed: %s. Retrying in %ss...",
+                func.__name__, attempt + 1, e, delay
             )
             await asyncio.sleep(delay)
 
@@ -6,6 +6,7 @@ This script runs unit tests and integration tests before push,
 ensuring code quality and test coverage.
 """
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -13,6 +14,13 @@ import json
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# pytest-xdist worker count ("auto" = one per CPU); CI can cap it, e.g. PYTEST_WORKERS=4
+PYTEST_WORKERS = os.environ.get("PYTEST_WORKERS", "auto")
+
+def parallel_args():
+    """pytest-xdist arguments; worksteal rebalances long tests across workers."""
+    return ["-n", PYTEST_WORKERS, "--dist=worksteal"]
+
 def run_pytest():
     """Run pytest with coverage report."""
     print("=" * 60)
@@ -28,6 +36,7 @@ def run_pytest():
         "--cov-report=html",
         "--cov-report=term",
         "--junit-xml=test-results.xml",
+        *parallel_args(),
     ]
     
     result = subprocess.run(cmd, cwd=PROJECT_ROOT)
@@ -44,6 +53,7 @@ def run_unit_tests():
         "tests/unit/",
         "-v",
         "--tb=short",
+        *parallel_args(),
     ]
     
     result = subprocess.run(cmd, cwd=PROJECT_ROOT)
@@ -60,6 +70,28 @@ def run_integration_tests():
         "tests/integration/",
         "-v",
         "--tb=short",
+        *parallel_args(),
+    ]
+    
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT)
+    return result.returncode
+
+def run_fast_tests():
+    """Run all tests with minimal output, stopping at the first failure."""
+    print("\n" + "=" * 60)
+    print("Running fast feedback tests...")
+    print("=" * 60)
+    
+    # Terse reporting and no cache plugin; -x makes xdist stop every worker on the first failure
+    cmd = [
+        "pytest",
+        "tests/",
+        "-q",
+        "--tb=line",
+        "--no-header",
+        "-p", "no:cacheprovider",
+        "-x",
+        *parallel_args(),
     ]
     
     result = subprocess.run(cmd, cwd=PROJECT_ROOT)
@@ -79,9 +111,11 @@ def main():
             return run_integration_tests()
         elif test_type == "all":
             return run_pytest()
+        elif test_type == "fast":
+            return run_fast_tests()
         else:
             print(f"Unknown test type: {test_type}")
-            print("Usage: git_test.py [unit|integration|all]")
+            print("Usage: git_test.py [unit|integration|all|fast]")
             return 1
     else:
         # Run all tests by default
@@ -13,6 +13,11 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound for a whole health check run, and for any single check, in seconds
+CHECK_TIMEOUT = 2.0
+PER_CHECK_TIMEOUT = 1.0
+CHECK_NAMES = ("database", "redis", "rabbitmq")
+
 
 class HealthChecker:
     """Health check for the template service."""
@@ -24,6 +29,9 @@ class HealthChecker:
             "status": "healthy",
             "checks": {}
         }
+        # Reused across runs so a check is a ping, not a new connection
+        self._redis = None
+        self._channel = None
 
     async def check_database(self) -> bool:
         """Check database connectivity."""
@@ -45,9 +53,14 @@ class HealthChecker:
     async def check_redis(self) -> bool:
         """Check Redis connectivity."""
         try:
-            from services.cache import cache_service
-            redis = await cache_service.get_connection()
-            await redis.ping()
+            if self._redis is None:
+                from services.cache import cache_service
+                if cache_service.pool is None:
+                    await cache_service.init_redis_pool()
+                self._redis = await cache_service.get_connection()
+                if self._redis is None:
+                    raise ConnectionError("Redis pool is not initialized")
+            await self._redis.ping()
             self.health_status["checks"]["redis"] = {"status": "up"}
             return True
         except Exception as e:
@@ -60,8 +73,17 @@ class HealthChecker:
     async def check_rabbitmq(self) -> bool:
         """Check RabbitMQ connectivity."""
         try:
-            from services.messaging import messaging_service
-            channel = await messaging_service.get_channel()
+            if self._channel is None or self._channel.is_closed:
+                from services.messaging import messaging_service
+                if messaging_service.connection is None:
+                    await messaging_service.init_rabbitmq_connection()
+                self._channel = await messaging_service.get_channel()
+                if self._channel is None:
+                    raise ConnectionError("RabbitMQ connection is not initialized")
+            # A cached channel can look open over a dead TCP connection, so
+            # make the broker answer: a passive declare of the exchange set up at init
+            from services.messaging import TEMPLATE_EXCHANGE
+            await self._channel.declare_exchange(TEMPLATE_EXCHANGE, passive=True)
             self.health_status["checks"]["rabbitmq"] = {"status": "up"}
             return True
         except Exception as e:
@@ -71,17 +93,39 @@ class HealthChecker:
             }
             return False
 
+    async def _run_check(self, name: str, check) -> bool:
+        """Run one check, recording a hang or an unexpected error as its status."""
+        try:
+            return await asyncio.wait_for(check(), timeout=PER_CHECK_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.health_status["checks"][name] = {"status": "timeout"}
+        except Exception as e:
+            self.health_status["checks"][name] = {
+                "status": "down",
+                "error": str(e)
+            }
+        return False
+
     async def run_all_checks(self) -> Dict[str, Any]:
         """Run all health checks."""
-        results = await asyncio.gather(
-            self.check_database(),
-            self.check_redis(),
-            self.check_rabbitmq(),
-            return_exceptions=True
-        )
+        self.health_status["timestamp"] = datetime.now().isoformat()
+        self.health_status["checks"] = {}
+        checks = (self.check_database, self.check_redis, self.check_rabbitmq)
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(self._run_check(name, check) for name, check in zip(CHECK_NAMES, checks))
+                ),
+                timeout=CHECK_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            # Only reached if a check ignores its own timeout
+            for name in CHECK_NAMES:
+                self.health_status["checks"].setdefault(name, {"status": "timeout"})
+            results = [False]
 
         # Determine overall status
-        if all(isinstance(r, bool) and r for r in results):
+        if all(results):
             self.health_status["status"] = "healthy"
         else:
             self.health_status["status"] = "unhealthy"
@@ -9,53 +9,133 @@ Runs:
 - Black: Code formatting check
 """
 
+import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Define the project root
 PROJECT_ROOT = Path(__file__).parent.parent
 PYTHON_FILES = ["app", "services", "tests", "scripts"]
 
-def run_command(cmd, description):
-    """Run a command and return the result."""
+# QC_INCREMENTAL=1 lints only the files changed against QC_BASE; QC_FULL=1
+# (e.g. in CI) always lints the whole tree
+QC_INCREMENTAL = os.environ.get("QC_INCREMENTAL") == "1" and os.environ.get("QC_FULL") != "1"
+QC_BASE = os.environ.get("QC_BASE", "origin/main")
+
+# Mypy runs through its daemon (dmypy) when available, so repeat runs only
+# re-check what changed; QC_DMYPY=0 runs plain mypy instead. The daemon keeps
+# running after this script exits; QC_DMYPY_STOP=1 (or 'dmypy stop') shuts it down
+QC_DMYPY = os.environ.get("QC_DMYPY", "1") == "1"
+QC_DMYPY_STOP = os.environ.get("QC_DMYPY_STOP") == "1"
+
+def _use_dmypy():
+    """Whether mypy should run through the daemon."""
+    return QC_DMYPY and shutil.which("dmypy") is not None
+
+def _mypy_cmd(args):
+    """
+    Mypy command line for the given arguments. 'dmypy run' starts the
+    daemon on first use and reuses its in-memory state afterwards.
+    """
+    if _use_dmypy():
+        return ["dmypy", "run", "--"] + args
+    return ["mypy"] + args
+
+def finish_dmypy():
+    """Stop the mypy daemon if asked to, otherwise say that it is still running."""
+    if not _use_dmypy():
+        return
+    if QC_DMYPY_STOP:
+        subprocess.run(["dmypy", "stop"], cwd=PROJECT_ROOT, capture_output=True)
+        print("\nmypy daemon stopped.")
+    else:
+        print("\nmypy daemon left running for faster re-runs; stop it with 'dmypy stop' or QC_DMYPY_STOP=1.")
+
+def changed_files():
+    """
+    Python files under PYTHON_FILES changed on this branch since QC_BASE,
+    relative to PROJECT_ROOT, or None if git cannot tell.
+    """
+    result = subprocess.run(
+        ["git", "diff", "--name-only", "--diff-filter=ACM", "--relative", "-z", f"{QC_BASE}...HEAD"],
+        cwd=PROJECT_ROOT,
+        capture_output=True
+    )
+    if result.returncode != 0:
+        return None
+    roots = tuple(f"{root}/" for root in PYTHON_FILES)
+    return [
+        name for name in map(os.fsdecode, result.stdout.split(b"\0"))
+        if name.endswith(".py") and name.startswith(roots)
+    ]
+
+def run_command(cmd):
+    """Run a command, capturing its output so parallel runs don't interleave."""
+    return subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+
+def print_result(description, cmd, result):
+    """Print the captured output of one check."""
     print(f"\n{'=' * 60}")
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}")
     print("=" * 60)
-    result = subprocess.run(cmd, cwd=PROJECT_ROOT)
-    return result.returncode
+    if result.stdout:
+        print(result.stdout, end="")
+    if result.stderr:
+        print(result.stderr, end="", file=sys.stderr)
 
 def main():
     """Run all quality checks."""
-    errors = []
+    targets = PYTHON_FILES
+    mypy_args = []
+    if QC_INCREMENTAL:
+        files = changed_files()
+        if files is None:
+            print(f"Could not diff against {QC_BASE}, checking the full tree.")
+        elif not files:
+            print(f"No Python files changed since {QC_BASE}.")
+            return 0
+        else:
+            print(f"Incremental mode: {len(files)} file(s) changed since {QC_BASE}.")
+            targets = files
+            # Type-check imported modules without reporting their errors
+            mypy_args = ["--follow-imports=silent"]
     
-    # Check if tools are installed
-    tools_to_check = ["pylint", "mypy", "flake8", "black"]
+    # pylint -j 0 shards across every core; one file is cheaper checked in-process
+    pylint_jobs = "0" if len(targets) > 1 else "1"
     
-    # Run Black formatting check
-    print("\n1. Checking code formatting with Black...")
-    black_cmd = ["black", "--check", "--diff"] + PYTHON_FILES
-    if run_command(black_cmd, "Black code formatter check") != 0:
-        errors.append("Black formatting issues found")
+    # (command, description, error message) - the tools are independent,
+    # so they all run at once and the total time is the slowest one
+    checks = [
+        (["black", "--check", "--diff"] + targets,
+         "Black code formatter check", "Black formatting issues found"),
+        (["flake8"] + targets,
+         "Flake8 style check", "Flake8 style issues found"),
+        (["pylint", "-j", pylint_jobs] + targets,
+         "Pylint analysis", "Pylint issues found"),
+        (_mypy_cmd(mypy_args + targets),
+         "Mypy type checking", "Mypy type checking issues found"),
+    ]
     
-    # Run Flake8
-    print("\n2. Checking style with Flake8...")
-    flake8_cmd = ["flake8"] + PYTHON_FILES
-    if run_command(flake8_cmd, "Flake8 style check") != 0:
-        errors.append("Flake8 style issues found")
+    print(f"Running {len(checks)} checks in parallel...")
+    failed = set()
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {executor.submit(run_command, cmd): i for i, (cmd, _, _) in enumerate(checks)}
+        for future in as_completed(futures):
+            i = futures[future]
+            cmd, description, _ = checks[i]
+            result = future.result()
+            print_result(description, cmd, result)
+            if result.returncode != 0:
+                failed.add(i)
     
-    # Run Pylint
-    print("\n3. Checking with Pylint...")
-    pylint_cmd = ["pylint"] + PYTHON_FILES
-    if run_command(pylint_cmd, "Pylint analysis") != 0:
-        errors.append("Pylint issues found")
+    # Report in a fixed order regardless of which check finished first
+    errors = [checks[i][2] for i in sorted(failed)]
     
-    # Run Mypy
-    print("\n4. Type checking with Mypy...")
-    mypy_cmd = ["mypy"] + PYTHON_FILES
-    if run_command(mypy_cmd, "Mypy type checking") != 0:
-        errors.append("Mypy type checking issues found")
+    finish_dmypy()
     
     # Summary
     print(f"\n{'=' * 60}")
@@ -7,36 +7,51 @@ import subprocess
 import sys
 import os
 import logging
+from typing import Sequence
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def run_command(command: str, description: str) -> bool:
-    """Run a shell command."""
+# Each step as a pre-split argv; sys.executable keeps every step on this interpreter
+STEPS = (
+    ((sys.executable, "-m", "pip", "install", "-r", "requirements.txt"), "Install Python dependencies"),
+    ((sys.executable, "scripts/migrate.py"), "Initialize database"),
+    ((sys.executable, "scripts/health_check.py"), "Run health checks"),
+)
+
+
+def run_command(argv: Sequence[str], description: str) -> bool:
+    """Run a command directly, without a shell in between."""
     logger.info(f"Running: {description}")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        logger.info(f"✓ {description} completed")
-        return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"✗ {description} failed: {e.stderr}")
+        # Only stderr is reported, so stdout (e.g. pip's progress) is never buffered
+        result = subprocess.run(
+            argv,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    except OSError as e:
+        logger.error(f"✗ {description} failed: {e}")
+        return False
+
+    if result.returncode != 0:
+        logger.error(f"✗ {description} failed: {result.stderr}")
         return False
 
+    logger.info(f"✓ {description} completed")
+    return True
+
 
 def main():
     """Run setup steps."""
     logger.info("=== Template Service Setup ===\n")
 
-    steps = [
-        ("pip install -r requirements.txt", "Install Python dependencies"),
-        ("python scripts/migrate.py", "Initialize database"),
-        ("python scripts/health_check.py", "Run health checks"),
-    ]
-
     success = True
-    for command, description in steps:
-        if not run_command(command, description):
+    for argv, description in STEPS:
+        if not run_command(argv, description):
             success = False
             logger.error(f"Setup failed at: {description}")
             break
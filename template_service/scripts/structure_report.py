@@ -7,11 +7,50 @@ and verifies Pylance compatibility.
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Directories never scanned for Python files
+SKIP_DIRS = frozenset({'.venv', 'venv', '__pycache__', '.git', '.pytest_cache'})
+
+# Imports live at the top of a file, so only this much of it is read
+IMPORT_SCAN_BYTES = 8192
+IMPORT_SCAN_LINES = 50
+
+# Matches a whole import statement line, indented or not, on raw bytes
+IMPORT_RE = re.compile(rb"^[ \t]*(?:import|from)[ \t]+[^\n]+", re.MULTILINE)
+
+def iter_python_files(path: str) -> Iterator[Path]:
+    """Yield every .py file under path, pruning SKIP_DIRS without descending into them."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield Path(entry.path)
+
+def iter_python_dirs(path: str) -> Iterator[str]:
+    """Yield path and every directory below it that directly holds a .py file."""
+    has_py = False
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.py'):
+                has_py = True
+    
+    if has_py:
+        yield path
+    for subdir in subdirs:
+        yield from iter_python_dirs(subdir)
+
 def get_directory_tree(path: Path, prefix: str = "", max_depth: int = 5, current_depth: int = 0) -> List[str]:
     """Generate a tree structure of the directory."""
     if current_depth >= max_depth:
@@ -40,17 +79,12 @@ def get_directory_tree(path: Path, prefix: str = "", max_depth: int = 5, current
 def check_init_files(path: Path) -> List[str]:
     """Check for proper __init__.py files in Python packages."""
     issues = []
-    for root, dirs, files in os.walk(path):
-        # Skip non-package directories
-        if any(skip in root for skip in ['.venv', 'venv', '__pycache__', '.git', '.pytest_cache']):
-            continue
-        
-        # Check if it's a Python package directory
-        if any(f.endswith('.py') for f in files):
-            if not Path(root, '__init__.py').exists():
-                rel_path = Path(root).relative_to(PROJECT_ROOT)
-                if str(rel_path) != '.':
-                    issues.append(f"Missing __init__.py in {rel_path}")
+    # Each directory holding Python files is a package candidate
+    for root in iter_python_dirs(str(path)):
+        if not os.path.lexists(os.path.join(root, '__init__.py')):
+            rel_path = Path(root).relative_to(PROJECT_ROOT)
+            if str(rel_path) != '.':
+                issues.append(f"Missing __init__.py in {rel_path}")
     
     return issues
 
@@ -58,19 +92,23 @@ def check_imports(filepath: Path) -> List[str]:
     """Check for common import issues in a Python file."""
     issues = []
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
+        with open(filepath, 'rb') as f:
+            head = f.read(IMPORT_SCAN_BYTES)
+        
+        lineno, pos = 1, 0
+        for match in IMPORT_RE.finditer(head):
+            lineno += head.count(b'\n', pos, match.start())
+            pos = match.start()
+            if lineno > IMPORT_SCAN_LINES:
+                break
             
-            for i, line in enumerate(lines[:50], 1):  # Check first 50 lines
-                line = line.strip()
-                if line.startswith('import ') or line.startswith('from '):
-                    # Check for relative imports that go beyond top-level package
-                    if '..' in line:
-                        issues.append(f"Line {i}: Relative import beyond top-level: {line}")
-                    # Check for circular imports
-                    if 'from app.main import' in line and 'app/api' in str(filepath):
-                        issues.append(f"Line {i}: Potential circular import: {line}")
+            line = match.group().strip().decode('utf-8', 'replace')
+            # Check for relative imports that go beyond top-level package
+            if '..' in line:
+                issues.append(f"Line {lineno}: Relative import beyond top-level: {line}")
+            # Check for circular imports
+            if 'from app.main import' in line and 'app/api' in str(filepath):
+                issues.append(f"Line {lineno}: Potential circular import: {line}")
     except Exception as e:
         issues.append(f"Error reading file: {e}")
     
@@ -103,12 +141,15 @@ def main():
     # Check Python files for import issues
     print("\n\n🔗 IMPORT ANALYSIS:")
     print("-" * 80)
+    # One walk of the tree, shared with the statistics below
+    py_files = list(iter_python_files(str(PROJECT_ROOT)))
+    
+    # File reads are I/O bound, so they overlap well on threads
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(check_imports, py_files))
+    
     all_import_issues = []
-    for py_file in PROJECT_ROOT.rglob("*.py"):
-        if any(skip in str(py_file) for skip in ['.venv', 'venv', '__pycache__', '.git']):
-            continue
-        
-        issues = check_imports(py_file)
+    for py_file, issues in zip(py_files, results):
         all_import_issues.extend([(py_file.relative_to(PROJECT_ROOT), issue) for issue in issues])
     
     if all_import_issues:
@@ -138,9 +179,6 @@ def main():
     # Python files count
     print("\n\n📊 PROJECT STATISTICS:")
     print("-" * 80)
-    py_files = list(PROJECT_ROOT.rglob("*.py"))
-    py_files = [f for f in py_files if not any(skip in str(f) for skip in ['.venv', 'venv', '__pycache__', '.git'])]
-    
     app_files = len([f for f in py_files if '/app/' in str(f).replace('\\', '/')])
     service_files = len([f for f in py_files if '/services/' in str(f).replace('\\', '/')])
     test_files = len([f for f in py_files if '/tests/' in str(f).replace('\\', '/')])
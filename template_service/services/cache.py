@@ -1,17 +1,38 @@
 import redis.asyncio as aioredis
 from redis.asyncio.client import Redis
-from pydantic import ValidationError
+from redis.exceptions import RedisError
+import orjson
 import os
-import json
 import logging
+from datetime import datetime
 from typing import Optional
-from app.schemas import TemplatePublic # Absolute import
+from app.schemas import TemplatePublic, TemplateType # Absolute import
 
 logger = logging.getLogger(__name__)
 
 # This reads from your .env file
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+def _encode_template(template: TemplatePublic) -> bytes:
+    """
+    Serializes a template for the cache.
+    """
+    return orjson.dumps(template.model_dump())
+
+
+def _decode_template(cached_data) -> TemplatePublic:
+    """
+    Rebuilds a template from the cache without re-validating it.
+    Only _encode_template writes these entries, so the fields are known good;
+    just the values JSON cannot carry natively are converted back.
+    """
+    data = orjson.loads(cached_data)
+    data["type"] = TemplateType(data["type"])
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+    return TemplatePublic.model_construct(**data)
+
+
 class CacheService:
     """
     Manages the Redis connection pool and all cache-related operations.
@@ -19,11 +40,13 @@ class CacheService:
     def __init__(self, redis_url: str):
         self.redis_url = redis_url
         self.pool = None
+        # One client shared by every caller; the pool does the multiplexing
+        self._redis: Optional[Redis] = None
 
     async def init_redis_pool(self):
         """
         Initializes the Redis connection pool.
-        Call this during the FastAPI lifespan startup.
+        Call this during the FastAPI lifespan startup; raises if Redis is unreachable.
         """
         try:
             self.pool = aioredis.ConnectionPool.from_url(
@@ -31,27 +54,31 @@ class CacheService:
                 max_connections=20,
                 decode_responses=True # Decode from bytes to string
             )
+            self._redis = aioredis.Redis(connection_pool=self.pool)
+            # The pool connects lazily, so ping to find out now if Redis is unreachable
+            await self._redis.ping()
             logger.info("Redis connection pool initialized.")
         except Exception as e:
             logger.error(f"Failed to initialize Redis pool: {e}")
+            raise
 
     async def close_redis_pool(self):
         """
         Closes the Redis connection pool.
         Call this during the FastAPI lifespan shutdown.
         """
+        self._redis = None
         if self.pool:
             await self.pool.disconnect()
             logger.info("Redis connection pool closed.")
 
     async def get_connection(self) -> Optional[Redis]:
         """
-        Gets a Redis connection from the pool.
+        Gets the shared Redis client backed by the pool.
         """
-        if not self.pool:
+        if self._redis is None:
             logger.error("Redis pool is not initialized.")
-            return None
-        return aioredis.Redis(connection_pool=self.pool)
+        return self._redis
 
     def _get_template_key(self, name: str, language: str) -> str:
         """
@@ -74,10 +101,13 @@ class CacheService:
             cached_data = await redis.get(key)
             if cached_data:
                 logger.info(f"Cache HIT for key: {key}")
-                # Parse the JSON string back into a Pydantic model
-                return TemplatePublic.model_validate_json(cached_data)
-        except (redis.RedisError, ValidationError, json.JSONDecodeError) as e:
-            logger.error(f"Error getting from cache or parsing: {e}")
+                # Rebuild the Pydantic model from the cached JSON
+                return _decode_template(cached_data)
+        except RedisError as e:
+            logger.error(f"Error getting from cache: {e}")
+        except (KeyError, ValueError) as e:
+            # Stale or foreign entry; treated as a miss and overwritten on the next set
+            logger.error(f"Error parsing cached template: {e}")
         
         logger.info(f"Cache MISS for key: {key}")
         return None
@@ -93,10 +123,9 @@ class CacheService:
 
         key = self._get_template_key(template.name, template.language)
         try:
-            # Serialize the Pydantic model to a JSON string
-            await redis.set(key, template.model_dump_json(), ex=ttl)
+            await redis.set(key, _encode_template(template), ex=ttl)
             logger.info(f"Cache SET for key: {key}")
-        except redis.RedisError as e:
+        except RedisError as e:
             logger.error(f"Error setting cache: {e}")
 
     async def clear_template_cache(self, name: str, language: str):
@@ -112,7 +141,7 @@ class CacheService:
         try:
             await redis.delete(key)
             logger.info(f"Cache CLEARED for key: {key}")
-        except redis.RedisError as e:
+        except RedisError as e:
             logger.error(f"Error clearing cache: {e}")
 
 # Create a single, shared instance
@@ -0,0 +1,103 @@
+"""Coalescing of concurrent cache misses in crud.get_template_by_name_cached."""
+import asyncio
+
+import pytest
+
+from app import crud
+
+
+class FakeLoader:
+    """Stands in for _load_public_template; each call is one database load."""
+
+    def __init__(self, result="template", error=None, delay=0.05):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.delay = delay
+
+    async def __call__(self, db, name, language):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def cache_miss(monkeypatch):
+    async def get_template_cache(name, language):
+        return None
+
+    monkeypatch.setattr(crud.cache_service, "get_template_cache", get_template_cache)
+    yield
+    assert crud._inflight == {}
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    fake = FakeLoader()
+    monkeypatch.setattr(crud, "_load_public_template", fake)
+    return fake
+
+
+async def test_concurrent_misses_share_one_load(loader):
+    results = await asyncio.gather(
+        *(crud.get_template_by_name_cached(None, "welcome") for _ in range(10))
+    )
+
+    assert results == ["template"] * 10
+    assert loader.calls == 1
+
+
+async def test_different_keys_load_separately(loader):
+    await asyncio.gather(
+        crud.get_template_by_name_cached(None, "welcome", "en"),
+        crud.get_template_by_name_cached(None, "welcome", "fr"),
+    )
+
+    assert loader.calls == 2
+
+
+async def test_loader_exception_reaches_every_waiter(monkeypatch):
+    error = RuntimeError("database down")
+    monkeypatch.setattr(crud, "_load_public_template", FakeLoader(error=error))
+
+    results = await asyncio.gather(
+        *(crud.get_template_by_name_cached(None, "welcome") for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    assert results == [error] * 5
+
+
+async def test_cancelled_leader_does_not_fail_its_waiters(loader):
+    leader = asyncio.ensure_future(crud.get_template_by_name_cached(None, "welcome"))
+    await asyncio.sleep(0.01)
+    waiters = [
+        asyncio.ensure_future(crud.get_template_by_name_cached(None, "welcome"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+
+    leader.cancel()
+    results = await asyncio.gather(*waiters)
+
+    assert results == ["template"] * 3
+    # The leader's load was abandoned; one waiter took over for the rest
+    assert loader.calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_cancelled_waiter_does_not_cancel_the_shared_load(loader):
+    leader = asyncio.ensure_future(crud.get_template_by_name_cached(None, "welcome"))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.ensure_future(crud.get_template_by_name_cached(None, "welcome"))
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+
+    assert await leader == "template"
+    assert loader.calls == 1
+    with pytest.raises(asyncio.CancelledError):
+        await waiter